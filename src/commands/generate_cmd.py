@@ -4,28 +4,38 @@ Generate command - Fetches content, processes via LLM, outputs Markdown.
 
 import os
 import sys
-import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 import typer
 from rich.console import Console
-from dotenv import load_dotenv
 import json
 
-from src.fetchers.rss import RSSFetcher
-from src.publishers.file_system import FileSystemPublisher
-from src.llm_processor import LLMProcessor
-from src.config.loader import load_config
-
 app = typer.Typer(help="Generate digests and save as Markdown")
 console = Console()
-logger = logging.getLogger(__name__)
+
+
+# Third-party loggers that emit a record per HTTP request/chunk at DEBUG
+_NOISY_LOGGERS = ("httpx", "httpcore", "openai", "urllib3")
 
 
 def setup_logging(verbose: bool = False):
     """Setup logging configuration."""
+    import logging
+
     level = logging.DEBUG if verbose else logging.INFO
+    # --verbose is meant for our own debug output, not per-request HTTP traces
+    for name in _NOISY_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    root = logging.getLogger()
+    if root.handlers:
+        # Already configured (repeated invocation in one process)
+        root.setLevel(level)
+        return
+
     logging.basicConfig(
         level=level,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -35,22 +45,50 @@ def setup_logging(verbose: bool = False):
     )
 
 
+DIGEST_CACHE_DIR = Path(".cache/digests")
+
+
+def _create_llm_processor(
+    api_key: str,
+    model: Optional[str],
+    base_url: Optional[str],
+    cache_dir: Optional[Path]
+):
+    """Import, construct and warm up the LLM processor (run off the main thread)."""
+    from src.llm_processor import LLMProcessor
+
+    processor = LLMProcessor(api_key=api_key, model=model, base_url=base_url, cache_dir=cache_dir)
+    processor.warm_up()
+    return processor
+
+
 @app.command()
 def run(
     config_name: str = typer.Option(..., "--config", "-c", help="Config name to run"),
     output_dir: str = typer.Option("content/digests", "--output", "-o", help="Output directory for digests"),
     days: Optional[int] = typer.Option(None, "--days", "-d", help="Days to look back (overrides config)"),
     limit: Optional[int] = typer.Option(None, "--limit", "-l", help="Limit number of articles (for testing)"),
+    workers: int = typer.Option(16, "--workers", "-w", min=1, help="Number of feeds to fetch concurrently"),
+    feed_cache: Optional[Path] = typer.Option(None, "--feed-cache", help="Directory for caching feeds between runs (conditional GET)"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Always call the LLM instead of reusing a cached digest for identical inputs"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose logging"),
     json_output: bool = typer.Option(False, "--json", "-j", help="Output result as JSON (for scripting)")
 ):
     """Generate a digest from RSS feeds and save as Markdown."""
+    # Heavy dependencies (openai, feedparser, ...) are imported here
+    # so that `--help` and argument errors don't pay for them.
+    from src.config.env import load_env
+    from src.fetchers.rss import RSSFetcher
+    from src.publishers.file_system import FileSystemPublisher
+    from src.config.loader import load_config
+
     setup_logging(verbose)
-    
+    started_at = datetime.now()
+
     console.print(f"Generating digest for [bold cyan]{config_name}[/bold cyan]...")
 
     # Load environment variables
-    load_dotenv(override=True)
+    load_env()
     openai_api_key = os.getenv("OPENAI_API_KEY")
     if not openai_api_key:
         console.print("[bold red]Error: OPENAI_API_KEY environment variable is required[/bold red]")
@@ -71,9 +109,19 @@ def run(
 
     # Step 1: Fetch articles
     console.print(f"\n[dim]Fetching articles from {len(config['feeds'])} feeds...[/dim]")
-    rss_fetcher = RSSFetcher(config['feeds'])
     days_lookback = days if days is not None else config.get('days_lookback', 7)
-    items = rss_fetcher.fetch(days_lookback=days_lookback)
+    # Importing openai, building its client and opening its connection are
+    # independent of the feeds, so do them in the background while they download
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        llm_future = executor.submit(
+            _create_llm_processor,
+            openai_api_key,
+            llm_model,
+            openai_base_url,
+            None if no_cache else DIGEST_CACHE_DIR
+        )
+        with RSSFetcher(config['feeds'], max_workers=workers, cache_dir=feed_cache) as rss_fetcher:
+            items = rss_fetcher.fetch(days_lookback=days_lookback)
 
     if not items:
         console.print("[bold yellow]No articles found.[/bold yellow]")
@@ -87,11 +135,7 @@ def run(
 
     # Step 2: Process with LLM
     console.print("[dim]Processing with LLM...[/dim]")
-    llm_processor = LLMProcessor(
-        api_key=openai_api_key,
-        model=llm_model,
-        base_url=openai_base_url
-    )
+    llm_processor = llm_future.result()
 
     prompt_template = config.get('prompt', {}).get('template', '')
     if not prompt_template:
@@ -101,7 +145,9 @@ def run(
     digest = llm_processor.process(
         items=items,
         prompt_template=prompt_template,
-        config_name=config['name']
+        config_name=config['name'],
+        now=started_at,
+        system_prompt=config.get('prompt', {}).get('system')
     )
 
     if not digest:
@@ -131,7 +177,10 @@ def run(
             console.print(f"[bold green]✓[/bold green] Digest saved to [cyan]{file_path}[/cyan]")
             # Show token usage
             usage = llm_processor.get_token_usage_summary()
-            console.print(f"[dim]Token usage: {usage['total_tokens']} tokens[/dim]")
+            console.print(
+                f"[dim]Token usage: {usage['total_tokens']} tokens "
+                f"({usage['cached_tokens']} cached prompt tokens)[/dim]"
+            )
     else:
         if json_output:
             print(json.dumps({"success": False, "error": "Failed to save digest"}))
@@ -4,111 +4,155 @@ Publish command - Reads Markdown digest and publishes to destinations.
 
 import os
 import sys
-import re
-import yaml
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional, TYPE_CHECKING
 
 import typer
 from rich.console import Console
-from dotenv import load_dotenv
 
-from src.core.models import DigestResult
-from src.publishers.email import EmailPublisher
-from src.publishers.github_pages import GitHubPagesPublisher
+if TYPE_CHECKING:
+    from src.core.models import DigestResult
 
 app = typer.Typer(help="Publish generated digests (e.g., via Email)")
 console = Console()
 
+# Frontmatter keys mapped onto DigestResult fields; the rest become metadata
+_FRONTMATTER_FIELDS = frozenset(("title", "date", "config", "sources_analyzed"))
+
+# Environment variables that must be set for `publish email`
+_REQUIRED_SMTP_VARS = ("SMTP_HOST", "SMTP_PORT", "SMTP_USERNAME", "SMTP_PASSWORD", "RECIPIENT_EMAIL")
+
+
+def read_file_bytes(path: Path) -> bytes:
+    """Read a whole file with plain os calls, skipping io's buffered reader."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, os.fstat(fd).st_size)
+        # os.read may return short, and the file may have grown since fstat
+        while chunk := os.read(fd, 1 << 16):
+            data += chunk
+        return data
+    finally:
+        os.close(fd)
+
+
+def parse_frontmatter(content: bytes) -> tuple[dict, str]:
+    """
+    Parse YAML frontmatter and markdown body from raw file content.
+
+    The frontmatter bytes are handed to YAML undecoded; only the body is
+    decoded as UTF-8.
+    """
+    import yaml
+
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    # Frontmatter must open with a '---' line at the very start of the file
+    if not content.startswith(b"---"):
+        return {}, content.decode("utf-8").strip()
+    fm_start = content.find(b"\n", 3)
+    if fm_start == -1 or content[3:fm_start].strip():
+        return {}, content.decode("utf-8").strip()
+
+    # Find the closing '---' line (trailing whitespace allowed)
+    fm_end = content.find(b"\n---", fm_start)
+    while fm_end != -1:
+        line_end = content.find(b"\n", fm_end + 4)
+        if line_end == -1:
+            line_end = len(content)
+        if not content[fm_end + 4:line_end].strip():
+            frontmatter_text = content[fm_start + 1:fm_end]
+            markdown_body = content[line_end + 1:].decode("utf-8").strip()
+            frontmatter = yaml.load(frontmatter_text, Loader=yaml_loader) or {}
+            return frontmatter, markdown_body
+        fm_end = content.find(b"\n---", fm_end + 1)
 
-def parse_frontmatter(content: str) -> tuple[dict, str]:
-    """Parse YAML frontmatter and markdown body from file content."""
-    # Match frontmatter between --- markers
-    pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)$'
-    match = re.match(pattern, content, re.DOTALL)
-    
-    if match:
-        frontmatter_text = match.group(1)
-        markdown_body = match.group(2).strip()
-        frontmatter = yaml.safe_load(frontmatter_text) or {}
-        return frontmatter, markdown_body
-    
     # No frontmatter found, treat all as body
-    return {}, content.strip()
+    return {}, content.decode("utf-8").strip()
+
+
+def digest_from_frontmatter(frontmatter: dict, markdown_body: str) -> "DigestResult":
+    """Rebuild a DigestResult from parsed frontmatter and body."""
+    from src.core.models import DigestResult
+
+    date_value = frontmatter.get("date")
+    if isinstance(date_value, datetime):
+        digest_date = date_value
+    elif isinstance(date_value, str):
+        digest_date = datetime.fromisoformat(date_value)
+    else:
+        digest_date = datetime.now()
+
+    return DigestResult(
+        title=frontmatter.get("title", "Digest"),
+        date=digest_date,
+        config_name=frontmatter.get("config", "unknown"),
+        sources_analyzed=frontmatter.get("sources_analyzed", 0),
+        markdown_body=markdown_body,
+        metadata={k: v for k, v in frontmatter.items() if k not in _FRONTMATTER_FIELDS}
+    )
 
 
 @app.command()
 def email(
-    file_path: Path = typer.Argument(..., help="Path to markdown digest file"),
+    file_paths: List[Path] = typer.Argument(..., help="Path(s) to markdown digest files"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose logging")
 ):
-    """Publish a digest via email."""
+    """Publish one or more digests via email over a single SMTP session."""
+    from src.config.env import load_env
+    from src.publishers.email import EmailPublisher
+
     if verbose:
         import logging
         logging.basicConfig(level=logging.DEBUG)
 
-    console.print(f"Publishing [cyan]{file_path}[/cyan] via Email...")
+    console.print(f"Publishing [cyan]{', '.join(map(str, file_paths))}[/cyan] via Email...")
 
-    # Validate file exists
-    if not file_path.exists():
-        console.print(f"[bold red]Error: File not found: {file_path}[/bold red]")
-        raise typer.Exit(1)
+    # Validate files exist
+    for file_path in file_paths:
+        if not file_path.exists():
+            console.print(f"[bold red]Error: File not found: {file_path}[/bold red]")
+            raise typer.Exit(1)
 
     # Load environment variables
-    load_dotenv(override=True)
-    
-    smtp_host = os.getenv("SMTP_HOST")
-    smtp_port = os.getenv("SMTP_PORT")
-    smtp_username = os.getenv("SMTP_USERNAME")
-    smtp_password = os.getenv("SMTP_PASSWORD")
-    recipient_email = os.getenv("RECIPIENT_EMAIL")
-    
-    missing_vars = []
-    for var, value in [
-        ("SMTP_HOST", smtp_host),
-        ("SMTP_PORT", smtp_port),
-        ("SMTP_USERNAME", smtp_username),
-        ("SMTP_PASSWORD", smtp_password),
-        ("RECIPIENT_EMAIL", recipient_email)
-    ]:
-        if not value:
-            missing_vars.append(var)
+    load_env()
     
+    env = os.environ
+    missing_vars = [var for var in _REQUIRED_SMTP_VARS if not env.get(var)]
     if missing_vars:
         console.print(f"[bold red]Error: Missing environment variables: {', '.join(missing_vars)}[/bold red]")
         raise typer.Exit(1)
 
+    smtp_host, smtp_port, smtp_username, smtp_password, recipient_email = (
+        env[var] for var in _REQUIRED_SMTP_VARS
+    )
+
     try:
         smtp_port = int(smtp_port)
     except ValueError:
         console.print("[bold red]Error: SMTP_PORT must be a valid integer[/bold red]")
         raise typer.Exit(1)
 
-    # Read and parse markdown file
-    with open(file_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    # Read and parse markdown files
+    digests = []
+    for file_path in file_paths:
+        content = read_file_bytes(file_path)
 
-    frontmatter, markdown_body = parse_frontmatter(content)
+        frontmatter, markdown_body = parse_frontmatter(content)
 
-    if not frontmatter:
-        console.print("[bold yellow]Warning: No frontmatter found in file[/bold yellow]")
-        frontmatter = {}
+        if not frontmatter:
+            console.print(f"[bold yellow]Warning: No frontmatter found in {file_path}[/bold yellow]")
+            frontmatter = {}
 
-    # Reconstruct DigestResult
-    digest = DigestResult(
-        title=frontmatter.get("title", "Digest"),
-        date=datetime.fromisoformat(frontmatter["date"]) if "date" in frontmatter else datetime.now(),
-        config_name=frontmatter.get("config", "unknown"),
-        sources_analyzed=frontmatter.get("sources_analyzed", 0),
-        markdown_body=markdown_body,
-        metadata={k: v for k, v in frontmatter.items() if k not in ["title", "date", "config", "sources_analyzed"]}
-    )
+        # Reconstruct DigestResult
+        digests.append((file_path, frontmatter, digest_from_frontmatter(frontmatter, markdown_body)))
 
-    # Send email
+    # Send emails
     smtp_starttls = os.getenv("SMTP_STARTTLS", "true").lower() == "true"
     from_email = os.getenv("FROM_EMAIL", smtp_username)
-    sender_name = os.getenv("EMAIL_SENDER_NAME", digest.config_name)
+    sender_name = os.getenv("EMAIL_SENDER_NAME")
 
     publisher = EmailPublisher(
         smtp_host=smtp_host,
@@ -118,22 +162,31 @@ def email(
         recipient_email=recipient_email,
         smtp_starttls=smtp_starttls,
         from_email=from_email,
-        sender_name=sender_name
+        sender_name=sender_name or digests[0][2].config_name
     )
 
-    subject_override = frontmatter.get("subject") or f"{digest.config_name} Digest"
-    success = publisher.publish(digest, subject_override=subject_override)
+    # One connection (TLS handshake + AUTH) is shared by every digest
+    failed = []
+    with publisher:
+        for file_path, frontmatter, digest in digests:
+            subject_override = frontmatter.get("subject") or f"{digest.config_name} Digest"
+            if not publisher.publish(
+                digest,
+                subject_override=subject_override,
+                sender_name=sender_name or digest.config_name
+            ):
+                failed.append(file_path)
 
-    if success:
-        console.print("[bold green]✓[/bold green] Digest emailed successfully!")
-    else:
-        console.print("[bold red]Error: Failed to send email[/bold red]")
+    if failed:
+        console.print(f"[bold red]Error: Failed to send email for {', '.join(map(str, failed))}[/bold red]")
         raise typer.Exit(1)
 
+    console.print(f"[bold green]✓[/bold green] {len(digests)} digest(s) emailed successfully!")
+
 
 @app.command()
 def github_pages(
-    file_path: Path = typer.Argument(..., help="Path to markdown digest file"),
+    file_paths: List[Path] = typer.Argument(..., help="Path(s) to markdown digest files"),
     repo_url: Optional[str] = typer.Option(
         None,
         "--repo",
@@ -143,20 +196,24 @@ def github_pages(
     commit_message: Optional[str] = typer.Option(None, "--message", "-m", help="Custom commit message"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose logging")
 ):
-    """Publish a digest to a GitHub Pages blog repository."""
+    """Publish one or more digests to a GitHub Pages blog repository in a single commit."""
+    from src.config.env import load_env
+    from src.publishers.github_pages import GitHubPagesPublisher
+
     if verbose:
         import logging
         logging.basicConfig(level=logging.DEBUG)
 
-    console.print(f"Publishing [cyan]{file_path}[/cyan] to GitHub Pages repo...")
+    console.print(f"Publishing [cyan]{', '.join(map(str, file_paths))}[/cyan] to GitHub Pages repo...")
 
-    # Validate file exists
-    if not file_path.exists():
-        console.print(f"[bold red]Error: File not found: {file_path}[/bold red]")
-        raise typer.Exit(1)
+    # Validate files exist
+    for file_path in file_paths:
+        if not file_path.exists():
+            console.print(f"[bold red]Error: File not found: {file_path}[/bold red]")
+            raise typer.Exit(1)
 
     # Load environment variables
-    load_dotenv(override=True)
+    load_env()
     
     # Use env var if option not provided
     if not repo_url:
@@ -173,41 +230,31 @@ def github_pages(
         repo_path = repo_url.replace("git@github.com:", "")
         repo_url = f"https://{github_token}@github.com/{repo_path}"
 
-    # Read and parse markdown file
-    with open(file_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    # Read and parse markdown files
+    digests = []
+    for file_path in file_paths:
+        content = read_file_bytes(file_path)
 
-    frontmatter, markdown_body = parse_frontmatter(content)
+        frontmatter, markdown_body = parse_frontmatter(content)
 
-    if not frontmatter:
-        console.print("[bold yellow]Warning: No frontmatter found in file[/bold yellow]")
-        frontmatter = {}
+        if not frontmatter:
+            console.print(f"[bold yellow]Warning: No frontmatter found in {file_path}[/bold yellow]")
+            frontmatter = {}
 
-    # Reconstruct DigestResult
-    date_value = frontmatter.get("date")
-    if isinstance(date_value, datetime):
-        digest_date = date_value
-    elif isinstance(date_value, str):
-        digest_date = datetime.fromisoformat(date_value)
-    else:
-        digest_date = datetime.now()
-    
-    digest = DigestResult(
-        title=frontmatter.get("title", "Digest"),
-        date=digest_date,
-        config_name=frontmatter.get("config", "unknown"),
-        sources_analyzed=frontmatter.get("sources_analyzed", 0),
-        markdown_body=markdown_body,
-        metadata={k: v for k, v in frontmatter.items() if k not in ["title", "date", "config", "sources_analyzed"]}
-    )
+        # Reconstruct DigestResult
+        digests.append(digest_from_frontmatter(frontmatter, markdown_body))
 
     # Publish to GitHub Pages
     publisher = GitHubPagesPublisher(repo_url=repo_url)
-    
-    success = publisher.publish(
-        digest,
+
+    if len(digests) == 1:
+        default_message = f"Add digest: {digests[0].title}"
+    else:
+        default_message = f"Add {len(digests)} digests"
+    success = publisher.publish_many(
+        digests,
         layout=layout,
-        commit_message=commit_message or f"Add digest: {digest.title}"
+        commit_message=commit_message or default_message
     )
 
     if success:
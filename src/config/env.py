@@ -0,0 +1,40 @@
+"""
+Cached .env loading for the CLI commands.
+"""
+
+import os
+from typing import Dict, Optional, Tuple
+
+# Parsed .env files keyed by path, stored with the mtime they were read at
+_ENV_CACHE: Dict[str, Tuple[int, Dict[str, str]]] = {}
+
+
+def load_env(dotenv_path: Optional[str] = None) -> None:
+    """
+    Load variables from a .env file into os.environ, overriding existing ones.
+
+    Behaves like `load_dotenv(override=True)`, but the parsed file is cached
+    by path and mtime, so repeated calls in one process don't re-read it.
+
+    Args:
+        dotenv_path: Path to the .env file (default: searched like load_dotenv)
+    """
+    if dotenv_path is None:
+        from dotenv import find_dotenv
+        dotenv_path = find_dotenv()
+        if not dotenv_path:
+            return
+
+    try:
+        mtime_ns = os.stat(dotenv_path).st_mtime_ns
+    except FileNotFoundError:
+        return
+
+    cached = _ENV_CACHE.get(dotenv_path)
+    if cached is None or cached[0] != mtime_ns:
+        from dotenv import dotenv_values
+        values = {k: v for k, v in dotenv_values(dotenv_path).items() if v is not None}
+        cached = (mtime_ns, values)
+        _ENV_CACHE[dotenv_path] = cached
+
+    os.environ.update(cached[1])
@@ -4,13 +4,53 @@ Supports multiple digest configs in the configs/ directory.
 """
 
 import os
-import toml
+import copy
+import tomllib
 import logging
+import threading
 from typing import Dict, Any, Optional
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+_REQUIRED_FIELDS = frozenset(('name', 'feeds'))
+
+# Parsed configs keyed by (resolved path, mtime_ns, size), so an edited
+# file is re-read while repeated loads within one process are free.
+_CONFIG_CACHE: Dict[tuple, Dict[str, Any]] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+class ConfigNotFoundError(FileNotFoundError):
+    """
+    Raised when a config file doesn't exist.
+
+    The list of available configs is only gathered when the error is
+    rendered or `available` is accessed, not when it is raised.
+    """
+
+    def __init__(self, config_path: Path, configs_dir: str):
+        super().__init__(f"Config file not found: {config_path}")
+        self.config_path = config_path
+        self.configs_dir = configs_dir
+
+    @property
+    def available(self) -> list:
+        """Names of the configs that do exist in the configs directory."""
+        return list_available_configs(self.configs_dir)
+
+    def __str__(self) -> str:
+        return (
+            f"Config file not found: {self.config_path}\n"
+            f"Available configs: {self.available}"
+        )
+
+
+def clear_config_cache() -> None:
+    """Drop all cached configs (mainly useful for tests)."""
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE.clear()
+
 
 def load_config(config_name: str, configs_dir: str = "configs") -> Dict[str, Any]:
     """
@@ -24,7 +64,7 @@ def load_config(config_name: str, configs_dir: str = "configs") -> Dict[str, Any
         Dictionary containing the parsed config
     
     Raises:
-        FileNotFoundError: If config file doesn't exist
+        ConfigNotFoundError: If config file doesn't exist (a FileNotFoundError)
         ValueError: If config is missing required fields
     """
     # Ensure .toml extension
@@ -33,34 +73,47 @@ def load_config(config_name: str, configs_dir: str = "configs") -> Dict[str, Any
     
     config_path = Path(configs_dir) / config_name
     
-    if not config_path.exists():
-        raise FileNotFoundError(
-            f"Config file not found: {config_path}\n"
-            f"Available configs: {list_available_configs(configs_dir)}"
-        )
-    
-    logger.info(f"Loading config from: {config_path}")
-    config = toml.load(config_path)
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
+        raise ConfigNotFoundError(config_path, configs_dir) from None
+
+    cache_key = (str(config_path.resolve()), st.st_mtime_ns, st.st_size)
+    with _CONFIG_CACHE_LOCK:
+        cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
+    logger.info("Loading config from: %s", config_path)
+    with open(config_path, "rb") as f:
+        config = tomllib.load(f)
     
     # Validate required fields
-    required_fields = ['name', 'feeds']
-    missing = [f for f in required_fields if f not in config]
+    missing = _REQUIRED_FIELDS - config.keys()
     if missing:
-        raise ValueError(f"Config missing required fields: {missing}")
+        raise ValueError(f"Config missing required fields: {sorted(missing)}")
     
     # Set defaults for optional fields
-    config.setdefault('description', '')
-    config.setdefault('schedule', 'weekly')
-    config.setdefault('days_lookback', 7)
-    config.setdefault('email_subject', f"{config['name']} Digest")
-    config.setdefault('sender_name', config['name'])
+    config = {
+        'description': '',
+        'schedule': 'weekly',
+        'days_lookback': 7,
+        'email_subject': f"{config['name']} Digest",
+        'sender_name': config['name'],
+    } | config
     
     # Validate feeds
     if not isinstance(config['feeds'], dict) or not config['feeds']:
         raise ValueError("Config 'feeds' must be a non-empty dictionary")
     
-    logger.info(f"Loaded config: {config['name']} ({len(config['feeds'])} feeds)")
-    return config
+    logger.info("Loaded config: %s (%s feeds)", config['name'], len(config['feeds']))
+
+    with _CONFIG_CACHE_LOCK:
+        # Drop entries for older versions of the same file
+        for key in [k for k in _CONFIG_CACHE if k[0] == cache_key[0]]:
+            del _CONFIG_CACHE[key]
+        _CONFIG_CACHE[cache_key] = config
+    return copy.deepcopy(config)
 
 
 def list_available_configs(configs_dir: str = "configs") -> list:
@@ -73,14 +126,14 @@ def list_available_configs(configs_dir: str = "configs") -> list:
     Returns:
         List of config file names (without .toml extension)
     """
-    configs_path = Path(configs_dir)
-    if not configs_path.exists():
+    try:
+        with os.scandir(configs_dir) as entries:
+            return [
+                entry.name[:-len('.toml')] for entry in entries
+                if entry.name.endswith('.toml') and entry.is_file()
+            ]
+    except FileNotFoundError:
         return []
-    
-    return [
-        f.stem for f in configs_path.glob("*.toml")
-        if f.is_file()
-    ]
 
 
 def get_config_info(config_name: str, configs_dir: str = "configs") -> Dict[str, Any]:
@@ -11,6 +11,9 @@ class BaseFetcher(ABC):
 
 
 class BasePublisher(ABC):
+    # Lets subclasses declare __slots__ without regaining a per-instance __dict__
+    __slots__ = ()
+
     @abstractmethod
     def publish(self, digest: DigestResult, **kwargs) -> bool:
         """Publish the digest result to a specific destination."""
@@ -1,9 +1,10 @@
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, Dict, Any
 
 
-class ContentItem(BaseModel):
+@dataclass(slots=True)
+class ContentItem:
     """Standardized format for incoming data (RSS, YouTube, Git)."""
     title: str
     url: str
@@ -12,11 +13,12 @@ class ContentItem(BaseModel):
     published_date: Optional[datetime] = None
 
 
-class DigestResult(BaseModel):
+@dataclass(slots=True, frozen=True)
+class DigestResult:
     """Standardized format for LLM output ready to be saved/published."""
     title: str
     date: datetime
     config_name: str
     sources_analyzed: int
     markdown_body: str
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
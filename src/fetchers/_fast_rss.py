@@ -0,0 +1,163 @@
+"""
+Fast-path RSS/Atom entry extraction.
+
+Reads only the fields the digest needs (title, link, summary and dates)
+with the C-accelerated ElementTree parser. Entries are returned as plain
+dicts using feedparser's key names so they can be handled the same way as
+feedparser entries. Anything that is not a well-formed RSS or Atom
+document raises, and the caller falls back to feedparser.
+"""
+
+import io
+from typing import Callable, Dict, List, Optional
+from xml.etree import ElementTree
+
+# Root element local names expected for each sniffed feed type
+_FEED_ROOTS = {"rss": frozenset(("rss", "RDF")), "atom": frozenset(("feed",))}
+_SNIFF_BYTES = 512
+_RSS_MARKERS = (b"<rss", b"<rdf:RDF")
+_ATOM_MARKER = b"<feed"
+_CONTENT_ENCODED = "{http://purl.org/rss/1.0/modules/content/}encoded"
+
+# Element local name -> feedparser key, mirroring feedparser's own mapping
+_RSS_DATE_FIELDS = {"pubDate": "published", "date": "updated"}
+_ATOM_DATE_FIELDS = {
+    "published": "published",
+    "issued": "published",
+    "updated": "updated",
+    "modified": "updated",
+}
+
+
+def _local_name(tag: str) -> str:
+    """Strip the namespace from an ElementTree tag."""
+    return tag.rpartition("}")[2]
+
+
+def _text(elem: ElementTree.Element) -> str:
+    """Return an element's text, flattening any inline (XHTML) markup."""
+    if len(elem):
+        return "".join(elem.itertext()).strip()
+    return (elem.text or "").strip()
+
+
+def sniff_feed_type(body: bytes) -> Optional[str]:
+    """
+    Detect the feed format from the start of the document.
+
+    Returns:
+        "rss" for RSS 1.0/2.0, "atom" for Atom, or None if neither root
+        element appears in the first few hundred bytes
+    """
+    head = body[:_SNIFF_BYTES]
+    if any(marker in head for marker in _RSS_MARKERS):
+        return "rss"
+    if _ATOM_MARKER in head:
+        return "atom"
+    return None
+
+
+def _extract_rss_item(elem: ElementTree.Element) -> Dict[str, str]:
+    """Extract feedparser-style fields from an RSS <item>."""
+    entry: Dict[str, str] = {}
+    guid = None
+    content = None
+
+    for child in elem:
+        name = _local_name(child.tag)
+        if name == "title":
+            entry["title"] = _text(child)
+        elif name == "link":
+            # Skip atom:link elements, which carry an href instead of text
+            if child.get("href") is None:
+                entry["link"] = _text(child)
+        elif name == "description":
+            entry["summary"] = _text(child)
+        elif name == "guid" and child.get("isPermaLink", "true") == "true":
+            guid = _text(child)
+        elif child.tag == _CONTENT_ENCODED:
+            content = _text(child)
+        elif name in _RSS_DATE_FIELDS:
+            entry.setdefault(_RSS_DATE_FIELDS[name], _text(child))
+
+    # feedparser uses a permalink guid when the item has no link
+    if guid and not entry.get("link"):
+        entry["link"] = guid
+    # ... and content:encoded when there is no description
+    if content and not entry.get("summary"):
+        entry["summary"] = content
+    return entry
+
+
+def _extract_atom_entry(elem: ElementTree.Element) -> Dict[str, str]:
+    """Extract feedparser-style fields from an Atom <entry>."""
+    entry: Dict[str, str] = {}
+    content = None
+
+    for child in elem:
+        name = _local_name(child.tag)
+        if name == "title":
+            entry["title"] = _text(child)
+        elif name == "link":
+            href = child.get("href")
+            if href and child.get("rel", "alternate") == "alternate" and "link" not in entry:
+                entry["link"] = href.strip()
+        elif name == "summary":
+            entry["summary"] = _text(child)
+        elif name == "content":
+            content = _text(child)
+        elif name in _ATOM_DATE_FIELDS:
+            entry.setdefault(_ATOM_DATE_FIELDS[name], _text(child))
+
+    # feedparser falls back to the content when there is no summary
+    if content and not entry.get("summary"):
+        entry["summary"] = content
+    return entry
+
+
+_EXTRACTORS: Dict[str, tuple[str, Callable[[ElementTree.Element], Dict[str, str]]]] = {
+    "rss": ("item", _extract_rss_item),
+    "atom": ("entry", _extract_atom_entry),
+}
+
+
+def fast_parse(body: bytes) -> List[Dict[str, str]]:
+    """
+    Extract entries from a well-formed RSS 1.0/2.0 or Atom document.
+
+    The format is sniffed up front so each document is walked with a
+    single entry tag and a format-specific extractor.
+
+    Args:
+        body: Raw feed document
+
+    Returns:
+        List of entry dicts with title, link, summary and date fields
+
+    Raises:
+        ElementTree.ParseError: If the document is not well-formed XML
+        ValueError: If the document is not an RSS or Atom feed
+        LookupError: If the declared encoding is unknown to the parser
+    """
+    feed_type = sniff_feed_type(body)
+    if feed_type is None:
+        raise ValueError("Could not detect an RSS or Atom root element")
+    entry_tag, extract = _EXTRACTORS[feed_type]
+
+    entries = []
+    parser = ElementTree.iterparse(io.BytesIO(body), events=("end",))
+
+    for _, elem in parser:
+        if _local_name(elem.tag) == entry_tag:
+            entries.append(extract(elem))
+            # Entries are consumed as they complete, so free their subtrees
+            elem.clear()
+
+    # The iterator only exposes .root at runtime, not in its type stubs
+    root = getattr(parser, "root", None)
+    root_tag = root.tag if root is not None else ""
+    # A mis-sniffed document would search for the wrong entry tag and come
+    # back empty, so make it fall back to feedparser instead
+    if _local_name(root_tag) not in _FEED_ROOTS[feed_type]:
+        raise ValueError(f"Root <{root_tag}> does not match sniffed {feed_type} feed")
+    return entries
@@ -0,0 +1,100 @@
+"""
+Feed Cache - Conditional GET support for the RSS fetcher.
+Stores feed bodies with their ETag/Last-Modified validators between runs.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class FeedCache:
+    """
+    On-disk cache of feed documents keyed by URL.
+
+    The body is kept alongside its validators because a 304 response has no
+    body, yet the digest still needs the feed's recent entries.
+    """
+
+    def __init__(self, cache_dir: Path):
+        """
+        Initialize the feed cache.
+
+        Args:
+            cache_dir: Directory holding cached feeds (created on first store)
+        """
+        self.cache_dir = Path(cache_dir)
+
+    def _paths(self, feed_url: str) -> Tuple[Path, Path]:
+        """Return the (body, metadata) file paths for a feed URL."""
+        key = hashlib.blake2b(feed_url.encode("utf-8"), digest_size=16).hexdigest()
+        return self.cache_dir / f"{key}.xml", self.cache_dir / f"{key}.json"
+
+    def load(self, feed_url: str) -> Optional[Tuple[bytes, Dict[str, str]]]:
+        """
+        Load a cached feed.
+
+        Args:
+            feed_url: URL of the RSS feed
+
+        Returns:
+            Tuple of (body, response headers) or None if not cached
+        """
+        body_path, meta_path = self._paths(feed_url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+
+        if meta.get("url") != feed_url:
+            return None
+        return body, meta.get("headers", {})
+
+    def store(self, feed_url: str, body: bytes, headers: Dict[str, str]) -> None:
+        """
+        Store a feed body and its response headers.
+
+        Args:
+            feed_url: URL of the RSS feed
+            body: Raw feed document
+            headers: Response headers (lower-cased names)
+        """
+        body_path, meta_path = self._paths(feed_url)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to temp files and rename so readers never see a torn entry
+            tmp_body = body_path.with_suffix(".xml.tmp")
+            tmp_body.write_bytes(body)
+            os.replace(tmp_body, body_path)
+
+            tmp_meta = meta_path.with_suffix(".json.tmp")
+            with open(tmp_meta, "w", encoding="utf-8") as f:
+                json.dump({"url": feed_url, "headers": headers}, f)
+            os.replace(tmp_meta, meta_path)
+        except OSError as e:
+            logger.warning("Failed to cache feed %s: %s", feed_url, e)
+
+    @staticmethod
+    def conditional_headers(headers: Dict[str, str]) -> Dict[str, str]:
+        """
+        Build conditional request headers from cached response headers.
+
+        Args:
+            headers: Cached response headers
+
+        Returns:
+            Dictionary with If-None-Match / If-Modified-Since as available
+        """
+        conditional = {}
+        if headers.get("etag"):
+            conditional["If-None-Match"] = headers["etag"]
+        if headers.get("last-modified"):
+            conditional["If-Modified-Since"] = headers["last-modified"]
+        return conditional
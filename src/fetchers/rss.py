@@ -3,29 +3,195 @@ RSS Feed Fetcher - Refactored for Content Curation Engine
 Retrieves articles from RSS feeds and returns ContentItems.
 """
 
+import calendar
+import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from pathlib import Path
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Optional
+from typing import Any, Iterator, List, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from xml.etree.ElementTree import ParseError
 import feedparser
+import httpx
 from dateutil import parser as date_parser
 
 from src.core.interfaces import BaseFetcher
 from src.core.models import ContentItem
+from src.fetchers._fast_rss import fast_parse
+from src.fetchers.feed_cache import FeedCache
 
 logger = logging.getLogger(__name__)
 
+# Exact RFC 822 formats tried before falling back to dateutil's heuristics
+_RFC822_FORMATS = (
+    "%a, %d %b %Y %H:%M:%S %z",
+    "%d %b %Y %H:%M:%S %z",
+    "%a, %d %b %Y %H:%M %z",
+)
+_UTC_SUFFIXES = (" GMT", " UTC", " UT", " Z")
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_string(date_str: str) -> datetime:
+    """
+    Parse a feed date string into a timezone-aware datetime.
+
+    RSS dates are nearly always RFC 822 and Atom dates ISO 8601, so both are
+    tried as exact formats first; dateutil only handles the leftovers.
+    Naive results are assumed to be UTC. Results are memoized since entries
+    published in one batch tend to share the exact same date string.
+
+    Raises:
+        ValueError: If the string cannot be parsed
+    """
+    value = date_str.strip()
+    parsed = None
+
+    if value[:4].isdigit():
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            pass
+
+    if parsed is None:
+        rfc_value = value
+        for suffix in _UTC_SUFFIXES:
+            if rfc_value.endswith(suffix):
+                rfc_value = rfc_value[:-len(suffix)] + " +0000"
+                break
+        for fmt in _RFC822_FORMATS:
+            try:
+                parsed = datetime.strptime(rfc_value, fmt)
+                break
+            except ValueError:
+                continue
+
+    if parsed is None:
+        parsed = date_parser.parse(value)
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+# Query parameters that only track the referrer and never identify an article
+_TRACKING_PARAMS = frozenset(("fbclid", "gclid", "mc_cid", "mc_eid", "ref", "source"))
+
+
+def _normalize_url(url: str) -> str:
+    """Normalize an article URL for duplicate detection."""
+    parts = urlsplit(url.strip())
+    query = parts.query
+    if query:
+        query = urlencode([
+            (key, value)
+            for key, value in parse_qsl(query, keep_blank_values=True)
+            if not key.startswith("utm_") and key not in _TRACKING_PARAMS
+        ])
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path.rstrip("/"),
+        query,
+        "",
+    ))
+
+
+def _dedupe_items(items: List[ContentItem]) -> List[ContentItem]:
+    """
+    Drop articles cross-posted to several feeds, keeping the first occurrence.
+
+    Articles count as duplicates if their URLs match once tracking parameters
+    and fragments are removed, or if their titles match case-insensitively
+    across different feeds. Same-titled posts within one feed (recurring
+    "Weekly Roundup"-style entries) are kept.
+    """
+    seen_urls = set()
+    # Title hash -> source of the first item seen with that title
+    seen_titles: Dict[bytes, str] = {}
+    unique = []
+
+    for item in items:
+        url = _normalize_url(item.url)
+        title_hash = hashlib.blake2b(
+            " ".join(item.title.lower().split()).encode("utf-8"), digest_size=8
+        ).digest()
+        if url in seen_urls:
+            continue
+        if seen_titles.setdefault(title_hash, item.source) != item.source:
+            continue
+        seen_urls.add(url)
+        unique.append(item)
+
+    return unique
+
 
 class RSSFetcher(BaseFetcher):
     """Fetches and parses RSS feeds, returning ContentItems."""
 
-    def __init__(self, feeds: Dict[str, str]):
+    def __init__(
+        self,
+        feeds: Dict[str, str],
+        max_workers: int = 8,
+        timeout: float = 30.0,
+        content_max_chars: int = 600,
+        cache_dir: Optional[Path] = None
+    ):
         """
         Initialize RSS fetcher with feed configuration.
 
         Args:
             feeds: Dictionary mapping feed names to URLs
+            max_workers: Maximum number of feeds fetched concurrently
+            timeout: Per-feed HTTP timeout in seconds
+            content_max_chars: Maximum characters of content kept per article
+                (the LLM prompt only uses the first 500)
+            cache_dir: Directory for caching feeds between runs, so that
+                unchanged feeds are revalidated with a conditional GET
+                (disabled if None)
         """
         self.feeds = feeds
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.content_max_chars = content_max_chars
+        self._cache = FeedCache(cache_dir) if cache_dir else None
+        self._client: Optional[httpx.Client] = None
+
+    def __enter__(self) -> "RSSFetcher":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled HTTP client, if one was opened."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def _get_client(self) -> httpx.Client:
+        """
+        Return the shared HTTP client, creating it on first use.
+
+        One pooled client is reused for every feed so that feeds served from
+        the same host (feedburner, substack, ...) share TCP/TLS connections.
+        """
+        if self._client is None:
+            pool_size = max(self.max_workers, 1)
+            self._client = httpx.Client(
+                headers={"User-Agent": feedparser.USER_AGENT, "Accept": feedparser.http.ACCEPT_HEADER},
+                timeout=self.timeout,
+                follow_redirects=True,
+                # No explicit transport, so HTTP(S)_PROXY / NO_PROXY from the
+                # environment are still honored as with feedparser's urllib
+                limits=httpx.Limits(
+                    max_connections=pool_size,
+                    max_keepalive_connections=pool_size,
+                ),
+            )
+        return self._client
 
     def fetch(self, days_lookback: int = 7, **kwargs) -> List[ContentItem]:
         """
@@ -37,22 +203,56 @@ class RSSFetcher(BaseFetcher):
         Returns:
             List of ContentItem objects
         """
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_lookback)
-        all_items = []
+        results = dict(self.iter_fetch(days_lookback))
 
-        for feed_name, feed_url in self.feeds.items():
-            logger.info(f"Fetching feed: {feed_name}")
-            try:
-                items = self._fetch_single_feed(feed_url, feed_name, cutoff_date)
-                all_items.extend(items)
-                logger.info(f"Retrieved {len(items)} articles from {feed_name}")
-            except Exception as e:
-                logger.error(f"Failed to fetch {feed_name}: {str(e)}")
-                continue
+        # Keep the configured feed order regardless of completion order
+        all_items = _dedupe_items([
+            item
+            for feed_name in self.feeds
+            for item in results.get(feed_name, [])
+        ])
 
-        logger.info(f"Total articles retrieved: {len(all_items)}")
+        logger.info("Total articles retrieved: %s", len(all_items))
         return all_items
 
+    def iter_fetch(self, days_lookback: int = 7) -> Iterator[Tuple[str, List[ContentItem]]]:
+        """
+        Fetch all configured feeds, yielding each one as soon as it completes.
+
+        Lets callers start working on early feeds while slower ones are still
+        downloading. Feeds that fail are logged and skipped.
+
+        Args:
+            days_lookback: Number of days to look back (default 7)
+
+        Yields:
+            Tuples of (feed name, ContentItems) in completion order
+        """
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_lookback)
+        if not self.feeds:
+            return
+
+        # Feeds are network-bound, so fetch them concurrently. The client is
+        # created up front so worker threads never race to open it.
+        self._get_client()
+        workers = max(1, min(self.max_workers, len(self.feeds)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            for feed_name, feed_url in self.feeds.items():
+                logger.info("Fetching feed: %s", feed_name)
+                future = executor.submit(self._fetch_single_feed, feed_url, feed_name, cutoff_date)
+                futures[future] = feed_name
+
+            for future in as_completed(futures):
+                feed_name = futures[future]
+                try:
+                    items = future.result()
+                except Exception as e:
+                    logger.error("Failed to fetch %s: %s", feed_name, e)
+                    continue
+                logger.info("Retrieved %s articles from %s", len(items), feed_name)
+                yield feed_name, items
+
     def _fetch_single_feed(
         self,
         feed_url: str,
@@ -70,28 +270,48 @@ class RSSFetcher(BaseFetcher):
         Returns:
             List of ContentItem objects
         """
-        feed = feedparser.parse(feed_url)
+        body, headers = self._download_feed(feed_url)
+        entries = self._parse_entries(body, headers)
         items = []
+        cutoff_ts = cutoff_date.timestamp()
 
-        for entry in feed.entries:
+        for entry in entries:
             try:
-                pub_date = self._parse_date(entry)
+                # feedparser's UTC struct_time allows a plain float comparison
+                # against the cutoff; string parsing is only the fallback
+                parsed = getattr(entry, 'published_parsed', None)
+                if isinstance(parsed, tuple):
+                    ts = calendar.timegm(parsed[:9])
+                    if ts < cutoff_ts:
+                        continue
+                    pub_date: Optional[datetime] = datetime.fromtimestamp(ts, timezone.utc)
+                else:
+                    pub_date = self._parse_date(entry)
+                    if pub_date and pub_date < cutoff_date:
+                        continue
 
-                if pub_date and pub_date < cutoff_date:
-                    continue
+                g = entry.get
+                title = g('title') or ''
+                summary = g('summary') or ''
+                description = g('description') or ''
 
                 # Build content from available fields
-                content_parts = []
-                if entry.get('summary'):
-                    content_parts.append(entry.get('summary'))
-                if entry.get('description') and entry.get('description') != entry.get('summary'):
-                    content_parts.append(entry.get('description'))
-                
-                content = '\n\n'.join(content_parts) if content_parts else entry.get('title', '')
+                content_parts = [summary] if summary else []
+                if description and description != summary:
+                    content_parts.append(description)
+
+                # Only a prefix of the content is ever used, so don't keep more
+                max_chars = self.content_max_chars
+                if content_parts and len(content_parts[0]) >= max_chars:
+                    content = content_parts[0][:max_chars]
+                elif content_parts:
+                    content = '\n\n'.join(content_parts)[:max_chars]
+                else:
+                    content = title[:max_chars]
 
                 item = ContentItem(
-                    title=entry.get('title', ''),
-                    url=entry.get('link', ''),
+                    title=title,
+                    url=g('link') or '',
                     content=content,
                     source=feed_name,
                     published_date=pub_date
@@ -101,11 +321,67 @@ class RSSFetcher(BaseFetcher):
                     items.append(item)
 
             except Exception as e:
-                logger.warning(f"Failed to parse entry: {str(e)}")
+                logger.warning("Failed to parse entry: %s", e)
                 continue
 
         return items
 
+    def _parse_entries(self, body: bytes, headers: Dict[str, str]) -> List[Any]:
+        """
+        Parse feed entries, trying the fast XML extractor before feedparser.
+
+        Args:
+            body: Raw feed document
+            headers: HTTP response headers
+
+        Returns:
+            List of entry dicts or feedparser entries
+        """
+        try:
+            return fast_parse(body)
+        except (ParseError, ValueError, LookupError) as e:
+            logger.debug("Fast feed parse failed, using feedparser: %s", e)
+
+        # Entry content only feeds the LLM prompt and is never rendered, so
+        # skip feedparser's costly HTML sanitizing and URI rewriting passes
+        feed = feedparser.parse(
+            body,
+            response_headers=headers,
+            resolve_relative_uris=False,
+            sanitize_html=False,
+        )
+        return feed.entries
+
+    def _download_feed(self, feed_url: str) -> Tuple[bytes, Dict[str, str]]:
+        """
+        Download the raw feed document.
+
+        Retrieval is kept separate from parsing so that network errors and
+        timeouts are handled here rather than inside feedparser.
+
+        Args:
+            feed_url: URL of the RSS feed
+
+        Returns:
+            Tuple of (response body, response headers)
+        """
+        cached = self._cache.load(feed_url) if self._cache else None
+        if cached is None:
+            response = self._get_client().get(feed_url)
+        else:
+            response = self._get_client().get(
+                feed_url, headers=FeedCache.conditional_headers(cached[1])
+            )
+            if response.status_code == 304:
+                logger.debug("Feed not modified, using cached copy: %s", feed_url)
+                return cached
+
+        response.raise_for_status()
+        body, headers = response.content, dict(response.headers)
+        if self._cache and ("etag" in headers or "last-modified" in headers):
+            self._cache.store(feed_url, body, headers)
+        return body, headers
+
     def _parse_date(self, entry) -> Optional[datetime]:
         """
         Parse publication date from feed entry.
@@ -116,21 +392,24 @@ class RSSFetcher(BaseFetcher):
         Returns:
             Parsed datetime or None if parsing fails
         """
+        # feedparser has usually already parsed the date into a UTC struct_time
+        for field in ('published_parsed', 'updated_parsed'):
+            parsed = getattr(entry, field, None)
+            if isinstance(parsed, tuple):
+                try:
+                    return datetime.fromtimestamp(calendar.timegm(parsed[:9]), timezone.utc)
+                except (TypeError, ValueError, OverflowError, OSError):
+                    pass
+
         date_fields = ['published', 'updated', 'created']
 
         for field in date_fields:
             date_str = entry.get(field)
             if date_str:
                 try:
-                    return date_parser.parse(date_str)
+                    return _parse_date_string(date_str)
                 except Exception:
                     continue
 
-        if hasattr(entry, 'published_parsed') and entry.published_parsed:
-            try:
-                return datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-            except Exception:
-                pass
-
-        logger.warning(f"Could not parse date for entry: {entry.get('title', 'Unknown')}")
+        logger.warning("Could not parse date for entry: %s", entry.get('title', 'Unknown'))
         return None
@@ -3,9 +3,16 @@ LLM Processor Module - Refactored for Content Curation Engine
 Processes ContentItems using LLM and returns DigestResult.
 """
 
+import hashlib
+import io
+import json
 import logging
-from typing import List, Dict, Optional
-from datetime import datetime, timedelta
+import os
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
+from datetime import date, datetime, timedelta
 from openai import OpenAI
 from openai import RateLimitError, APIError, APIConnectionError
 
@@ -13,11 +20,36 @@ from src.core.models import ContentItem, DigestResult
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SYSTEM_PROMPT = (
+    "You are a skilled editor creating weekly news digests. Analyze the provided "
+    "articles and create a comprehensive digest in clean, semantic HTML."
+)
+
+
+@lru_cache(maxsize=32)
+def _split_prompt_template(prompt_template: str) -> Tuple[str, ...]:
+    """
+    Split a prompt template around its {article_list} placeholders.
+
+    The article list is spliced in between the formatted parts rather than
+    passed through str.format, so braces in article content are left alone
+    and the large list is never scanned for placeholders.
+    """
+    return tuple(prompt_template.split("{article_list}"))
+
 
 class LLMProcessor:
     """Processes ContentItems using LLM via OpenAI-compatible APIs."""
 
-    def __init__(self, api_key: str, model: Optional[str] = None, base_url: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: str,
+        model: Optional[str] = None,
+        base_url: Optional[str] = None,
+        max_retries: int = 5,
+        cache_dir: Optional[Path] = None,
+        cache_ttl: float = 24 * 60 * 60
+    ):
         """
         Initialize LLM processor.
 
@@ -25,22 +57,53 @@ class LLMProcessor:
             api_key: OpenAI-compatible API key
             model: Model to use (optional, will use LLM_MODEL env var or default)
             base_url: Base URL for OpenAI-compatible API (optional)
+            max_retries: Retries for rate limits, timeouts, connection and 5xx
+                errors; the client backs off exponentially with jitter and
+                honors Retry-After headers
+            cache_dir: Directory for caching generated digests, so reruns with
+                identical inputs skip the LLM call (disabled if None)
+            cache_ttl: Maximum age in seconds of a reusable cached digest
         """
-        import os
         if model is None:
             model = os.getenv("LLM_MODEL", "gpt-4o-mini")
 
         if base_url:
-            self.client = OpenAI(base_url=base_url, api_key=api_key)
-            logger.info(f"LLM Processor initialized with model: {model}, base_url: {base_url}")
+            self.client = OpenAI(base_url=base_url, api_key=api_key, max_retries=max_retries)
+            logger.info("LLM Processor initialized with model: %s, base_url: %s", model, base_url)
         else:
-            self.client = OpenAI(api_key=api_key)
-            logger.info(f"LLM Processor initialized with model: {model}")
+            self.client = OpenAI(api_key=api_key, max_retries=max_retries)
+            logger.info("LLM Processor initialized with model: %s", model)
 
         self.model = model
         self.total_tokens_used = 0
+        self.cached_tokens_used = 0
+
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_ttl = cache_ttl
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def warm_up(self) -> None:
+        """
+        Open the API connection ahead of the first real request.
+
+        Best effort: a cheap model listing pays the TCP/TLS handshake while
+        other work (feed fetching) is still running, and the connection is
+        then reused from the client's pool.
+        """
+        try:
+            self.client.with_options(max_retries=0, timeout=5.0).models.list()
+        except Exception as e:
+            logger.debug("LLM connection warm-up failed: %s", e)
 
-    def process(self, items: List[ContentItem], prompt_template: str, config_name: str) -> Optional[DigestResult]:
+    def process(
+        self,
+        items: List[ContentItem],
+        prompt_template: str,
+        config_name: str,
+        now: Optional[datetime] = None,
+        system_prompt: Optional[str] = None
+    ) -> Optional[DigestResult]:
         """
         Process ContentItems and generate a DigestResult.
 
@@ -48,6 +111,10 @@ class LLMProcessor:
             items: List of ContentItem objects
             prompt_template: Prompt template for digest generation
             config_name: Name of the config (for metadata)
+            now: Reference time for the date range and digest date (default: now)
+            system_prompt: Static instructions sent as the system message. Keeping
+                them here and only the articles in the user message gives every run
+                an identical prompt prefix that providers can cache.
 
         Returns:
             DigestResult object or None if failed
@@ -57,8 +124,10 @@ class LLMProcessor:
                 logger.warning("No items provided for digest generation")
                 return None
 
+            now = now or datetime.now()
+
             # Calculate date range
-            end_date = datetime.now()
+            end_date = now
             start_date = end_date - timedelta(days=7)  # Default to 7 days
             date_range = f"{start_date.strftime('%b %d')} - {end_date.strftime('%b %d, %Y')}"
 
@@ -66,37 +135,22 @@ class LLMProcessor:
             item_list = self._format_items_for_prompt(items)
 
             # Format prompt
-            prompt = prompt_template.format(
-                article_count=len(items),
-                article_list=item_list,
-                date_range=date_range
+            prompt = item_list.join(
+                part.format(article_count=len(items), date_range=date_range)
+                for part in _split_prompt_template(prompt_template)
             )
 
-            logger.info(f"Generating digest for {len(items)} items")
-
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a skilled editor creating weekly news digests. Analyze the provided articles and create a comprehensive digest in clean, semantic HTML."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.5,
-                max_tokens=4000
-            )
+            system_prompt = system_prompt or DEFAULT_SYSTEM_PROMPT
+            cache_key = self._cache_key(system_prompt, prompt)
+            digest_html = self._load_cached_digest(cache_key)
 
-            # Track token usage
-            if hasattr(response, 'usage'):
-                tokens = response.usage.total_tokens
-                self.total_tokens_used += tokens
-                logger.info(f"Digest generation tokens used: {tokens}")
-
-            digest_html = response.choices[0].message.content.strip()
+            if digest_html is None:
+                logger.info("Generating digest for %s items", len(items))
+                digest_html = self._generate(system_prompt, prompt)
+                if digest_html is None:
+                    logger.error("LLM returned no content for the digest")
+                    return None
+                self._store_cached_digest(cache_key, digest_html)
 
             # Convert HTML to Markdown-like content (the LLM returns HTML which is fine)
             markdown_body = digest_html
@@ -105,7 +159,7 @@ class LLMProcessor:
 
             return DigestResult(
                 title=f"{config_name} Digest",
-                date=datetime.now(),
+                date=now,
                 config_name=config_name,
                 sources_analyzed=len(items),
                 markdown_body=markdown_body,
@@ -116,18 +170,112 @@ class LLMProcessor:
             )
 
         except RateLimitError as e:
-            logger.warning(f"Rate limit hit during digest generation: {e}")
+            logger.warning("Rate limit hit during digest generation: %s", e)
             return None
         except APIConnectionError as e:
-            logger.error(f"API connection error during digest generation: {e}")
+            logger.error("API connection error during digest generation: %s", e)
             return None
         except APIError as e:
-            logger.error(f"API error during digest generation: {e}")
+            logger.error("API error during digest generation: %s", e)
             return None
         except Exception as e:
-            logger.error(f"Error generating digest: {e}", exc_info=True)
+            logger.error("Error generating digest: %s", e, exc_info=True)
             return None
 
+    def _generate(self, system_prompt: str, prompt: str) -> Optional[str]:
+        """
+        Run the chat completion and return the generated digest HTML.
+
+        Args:
+            system_prompt: System message content
+            prompt: User message content
+
+        Returns:
+            Generated digest HTML, or None if the stream carried no content
+        """
+        # Stream the response so tokens are consumed as they are generated;
+        # usage arrives in a final chunk with no choices
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {
+                    "role": "system",
+                    "content": system_prompt
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            temperature=0.5,
+            max_tokens=4000,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+
+        buf = io.StringIO()
+        usage = None
+        for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    buf.write(delta)
+            if chunk.usage is not None:
+                usage = chunk.usage
+
+        # Track token usage
+        if usage is not None:
+            tokens = usage.total_tokens
+            details = getattr(usage, 'prompt_tokens_details', None)
+            cached = getattr(details, 'cached_tokens', None) or 0
+            self.total_tokens_used += tokens
+            self.cached_tokens_used += cached
+            logger.info("Digest generation tokens used: %s (%s cached prompt tokens)", tokens, cached)
+
+        # A filtered, truncated or empty response streams no content deltas
+        return buf.getvalue().strip() or None
+
+    def _cache_key(self, system_prompt: str, prompt: str) -> str:
+        """Hash everything that determines the LLM response."""
+        payload = json.dumps(
+            {"model": self.model, "system": system_prompt, "prompt": prompt},
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _load_cached_digest(self, cache_key: str) -> Optional[str]:
+        """Return a cached digest for this key if one exists and is fresh."""
+        if self.cache_dir is None:
+            return None
+
+        path = self.cache_dir / f"{cache_key}.html"
+        try:
+            if time.time() - path.stat().st_mtime > self.cache_ttl:
+                self.cache_misses += 1
+                return None
+            digest_html = path.read_text(encoding="utf-8")
+        except OSError:
+            self.cache_misses += 1
+            return None
+
+        self.cache_hits += 1
+        logger.info("Digest cache hit (%s hits, %s misses)", self.cache_hits, self.cache_misses)
+        return digest_html
+
+    def _store_cached_digest(self, cache_key: str, digest_html: str) -> None:
+        """Atomically write a generated digest to the cache."""
+        if self.cache_dir is None:
+            return
+
+        path = self.cache_dir / f"{cache_key}.html"
+        tmp_path = path.with_suffix(".html.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(digest_html, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Failed to cache digest: %s", e)
+
     def _format_items_for_prompt(self, items: List[ContentItem]) -> str:
         """
         Format ContentItems into a readable list for the LLM prompt.
@@ -138,25 +286,43 @@ class LLMProcessor:
         Returns:
             Formatted string with item details
         """
-        formatted = []
+        buf = io.StringIO()
+        write = buf.write
+        sep = ""
+        # Articles in a digest share few distinct days, so format each day once
+        date_strs: Dict[date, str] = {}
 
         for i, item in enumerate(items, 1):
-            pub_date_str = item.published_date.strftime('%Y-%m-%d') if item.published_date else 'Unknown'
-
-            item_text = f"""
-Article {i}:
-Title: {item.title}
-URL: {item.url}
-Source: {item.source}
-Published: {pub_date_str}
-Content: {item.content[:500] if item.content else 'No content available'}
-"""
-            formatted.append(item_text.strip())
+            if item.published_date:
+                day = item.published_date.date()
+                pub_date_str = date_strs.get(day)
+                if pub_date_str is None:
+                    pub_date_str = date_strs[day] = day.strftime('%Y-%m-%d')
+            else:
+                pub_date_str = 'Unknown'
+
+            content = item.content[:500].rstrip() if item.content else 'No content available'
+
+            write(sep)
+            write("Article ")
+            write(str(i))
+            write(":\nTitle: ")
+            write(item.title)
+            write("\nURL: ")
+            write(item.url)
+            write("\nSource: ")
+            write(item.source)
+            write("\nPublished: ")
+            write(pub_date_str)
+            write("\nContent: ")
+            write(content)
+            sep = "\n\n---\n\n"
 
-        return "\n\n---\n\n".join(formatted)
+        return buf.getvalue()
 
     def get_token_usage_summary(self) -> Dict:
         """Get summary of token usage."""
         return {
-            'total_tokens': self.total_tokens_used
+            'total_tokens': self.total_tokens_used,
+            'cached_tokens': self.cached_tokens_used
         }
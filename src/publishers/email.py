@@ -3,11 +3,14 @@ Email Publisher - Publishes DigestResult via email.
 """
 
 import logging
+import os
+import re
 import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from pathlib import Path
-from typing import Optional
+import threading
+from email.message import EmailMessage
+from email.utils import formataddr
+from functools import lru_cache
+from typing import Optional, Tuple
 import markdown
 
 from src.core.interfaces import BasePublisher
@@ -15,10 +18,107 @@ from src.core.models import DigestResult
 
 logger = logging.getLogger(__name__)
 
+# Fallback email template, split once at import into the static fragments
+# around its two insertion points.
+_SIMPLE_TEMPLATE = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>RSS Digest</title>
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        .container {
+            background-color: white;
+            padding: 40px;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        h1 {
+            color: #e3120b;
+            border-bottom: 3px solid #e3120b;
+            padding-bottom: 10px;
+        }
+        h2 {
+            color: #2c3e50;
+            margin-top: 30px;
+        }
+        a {
+            color: #e3120b;
+            text-decoration: none;
+        }
+        a:hover {
+            text-decoration: underline;
+        }
+        .footer {
+            margin-top: 40px;
+            padding-top: 20px;
+            border-top: 1px solid #ddd;
+            font-size: 0.9em;
+            color: #666;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>🗞️ Your RSS Digest</h1>
+        <p><strong>{date_range}</strong></p>
+
+        {digest_html}
+
+        <div class="footer">
+            <p>This digest was automatically generated.</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+_HTML_PRE, _rest = _SIMPLE_TEMPLATE.split("{date_range}")
+_HTML_MID, _HTML_POST = _rest.split("{digest_html}")
+del _rest
+
+# Placeholders in template files; re.split with a capturing group keeps the
+# placeholder names at odd indices so they can be filled in a single pass
+_PLACEHOLDER_RE = re.compile(r"\{\{(DIGEST_CONTENT|DATE_RANGE)\}\}")
+
+# One converter is reused instead of rebuilding it for every email; Markdown
+# instances keep per-document state, so conversions are serialized
+_MARKDOWN = markdown.Markdown()
+_MARKDOWN_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=32)
+def _render_markdown(text: str) -> str:
+    """Convert a digest body to HTML, memoized for repeated sends."""
+    with _MARKDOWN_LOCK:
+        return _MARKDOWN.reset().convert(text)
+
+
+@lru_cache(maxsize=8)
+def _read_template_parts(template_path: str, mtime_ns: int) -> Tuple[str, ...]:
+    """Read a template split around its placeholders; mtime_ns keys out stale copies."""
+    with open(template_path, 'r', encoding='utf-8') as f:
+        return tuple(_PLACEHOLDER_RE.split(f.read()))
+
 
 class EmailPublisher(BasePublisher):
     """Publishes digests via email."""
 
+    __slots__ = (
+        "smtp_host", "smtp_port", "smtp_username", "smtp_password",
+        "recipient_email", "smtp_starttls", "from_email", "sender_name",
+        "timeout", "_from_header", "_server", "_keep_alive",
+    )
+
     def __init__(
         self,
         smtp_host: str,
@@ -28,7 +128,8 @@ class EmailPublisher(BasePublisher):
         recipient_email: str,
         smtp_starttls: bool = True,
         from_email: Optional[str] = None,
-        sender_name: str = "RSS Digest"
+        sender_name: str = "RSS Digest",
+        timeout: float = 30.0
     ):
         """
         Initialize email publisher.
@@ -42,6 +143,7 @@ class EmailPublisher(BasePublisher):
             smtp_starttls: Whether to use STARTTLS encryption
             from_email: Sender email address (defaults to smtp_username)
             sender_name: Display name for sender
+            timeout: Timeout in seconds for SMTP socket operations
         """
         self.smtp_host = smtp_host
         self.smtp_port = smtp_port
@@ -51,14 +153,41 @@ class EmailPublisher(BasePublisher):
         self.smtp_starttls = smtp_starttls
         self.from_email = from_email or smtp_username
         self.sender_name = sender_name
+        self.timeout = timeout
+        self._from_header = formataddr((sender_name, self.from_email))
+
+        # Authenticated SMTP session, reused across sends while the
+        # publisher is used as a context manager
+        self._server: Optional[smtplib.SMTP] = None
+        self._keep_alive = False
+
+        logger.info("EmailPublisher initialized with host: %s:%s", smtp_host, smtp_port)
+
+    def __enter__(self) -> "EmailPublisher":
+        """Keep the SMTP connection open across publish() calls."""
+        self._keep_alive = True
+        return self
 
-        logger.info(f"EmailPublisher initialized with host: {smtp_host}:{smtp_port}")
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._keep_alive = False
+        self.close()
+
+    def close(self) -> None:
+        """Close the SMTP connection if one is open."""
+        server, self._server = self._server, None
+        if server is None:
+            return
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
 
     def publish(
         self,
         digest: DigestResult,
         template_path: Optional[str] = "templates/email_template.html",
         subject_override: Optional[str] = None,
+        sender_name: Optional[str] = None,
         **kwargs
     ) -> bool:
         """
@@ -68,6 +197,7 @@ class EmailPublisher(BasePublisher):
             digest: The DigestResult to publish
             template_path: Path to HTML email template
             subject_override: Optional custom subject line
+            sender_name: Optional display name overriding the publisher's default
             **kwargs: Additional options
 
         Returns:
@@ -75,7 +205,7 @@ class EmailPublisher(BasePublisher):
         """
         try:
             # Convert Markdown body to HTML
-            html_content = markdown.markdown(digest.markdown_body)
+            html_content = _render_markdown(digest.markdown_body)
 
             # Build date range string
             date_range = f"{digest.date.strftime('%b %d, %Y')}"
@@ -89,32 +219,58 @@ class EmailPublisher(BasePublisher):
             else:
                 subject = f"{digest.title}: {date_range} ({digest.sources_analyzed} articles)"
 
-            msg = MIMEMultipart('alternative')
+            msg = EmailMessage()
             msg['Subject'] = subject
-            msg['From'] = f"{self.sender_name} <{self.from_email}>"
+            msg['From'] = formataddr((sender_name, self.from_email)) if sender_name else self._from_header
             msg['To'] = self.recipient_email
-
-            # Attach HTML content
-            html_part = MIMEText(full_html, 'html')
-            msg.attach(html_part)
+            msg.set_content(full_html, subtype='html')
 
             # Send email
-            logger.info(f"Sending digest to {self.recipient_email}")
-            server = self._create_smtp_connection()
-            server.send_message(msg)
-            server.quit()
+            logger.info("Sending digest to %s", self.recipient_email)
+            try:
+                self._get_server().send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # Connection dropped between the health check and the send
+                logger.info("SMTP connection lost, reconnecting")
+                self.close()
+                self._get_server().send_message(msg)
+            except smtplib.SMTPResponseException as e:
+                # Permanent (5xx) rejections won't succeed on a new connection
+                if not 400 <= e.smtp_code < 500:
+                    raise
+                logger.info("Transient SMTP error %s, reconnecting", e.smtp_code)
+                self.close()
+                self._get_server().send_message(msg)
 
             logger.info("Email sent successfully")
             return True
 
         except Exception as e:
-            logger.error(f"Error sending email: {e}")
+            logger.error("Error sending email: %s", e)
             return False
 
+        finally:
+            if not self._keep_alive:
+                self.close()
+
+    def _get_server(self) -> smtplib.SMTP:
+        """Return the open SMTP connection, reconnecting if it went stale."""
+        if self._server is not None:
+            try:
+                if self._server.noop()[0] == 250:
+                    return self._server
+            except (smtplib.SMTPException, OSError):
+                pass
+            logger.info("SMTP connection is stale, reconnecting")
+            self.close()
+
+        self._server = self._create_smtp_connection()
+        return self._server
+
     def _create_smtp_connection(self) -> smtplib.SMTP:
         """Create and configure SMTP connection."""
         try:
-            server = smtplib.SMTP(self.smtp_host, self.smtp_port)
+            server = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=self.timeout)
 
             if self.smtp_starttls:
                 server.starttls()
@@ -123,90 +279,33 @@ class EmailPublisher(BasePublisher):
             return server
 
         except smtplib.SMTPAuthenticationError as e:
-            logger.error(f"SMTP authentication failed: {e}")
+            logger.error("SMTP authentication failed: %s", e)
             raise
         except smtplib.SMTPConnectError as e:
-            logger.error(f"Failed to connect to SMTP server: {e}")
+            logger.error("Failed to connect to SMTP server: %s", e)
             raise
         except smtplib.SMTPException as e:
-            logger.error(f"SMTP error: {e}")
+            logger.error("SMTP error: %s", e)
             raise
 
     def _load_template(self, template_path: Optional[str], digest_html: str, date_range: str) -> str:
         """Load email template and inject content."""
-        if template_path and Path(template_path).exists():
+        if template_path:
             try:
-                with open(template_path, 'r', encoding='utf-8') as f:
-                    template = f.read()
-                full_html = template.replace('{{DIGEST_CONTENT}}', digest_html)
-                full_html = full_html.replace('{{DATE_RANGE}}', date_range)
-                return full_html
+                parts = _read_template_parts(template_path, os.stat(template_path).st_mtime_ns)
+            except FileNotFoundError:
+                pass
             except Exception as e:
-                logger.warning(f"Failed to load template: {e}. Using simple template.")
+                logger.warning("Failed to load template: %s. Using simple template.", e)
+            else:
+                values = {'DIGEST_CONTENT': digest_html, 'DATE_RANGE': date_range}
+                return "".join(
+                    values[part] if i % 2 else part
+                    for i, part in enumerate(parts)
+                )
 
         return self._create_simple_template(digest_html, date_range)
 
     def _create_simple_template(self, digest_html: str, date_range: str) -> str:
         """Create a simple HTML email template."""
-        return f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>RSS Digest</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            background-color: white;
-            padding: 40px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        h1 {{
-            color: #e3120b;
-            border-bottom: 3px solid #e3120b;
-            padding-bottom: 10px;
-        }}
-        h2 {{
-            color: #2c3e50;
-            margin-top: 30px;
-        }}
-        a {{
-            color: #e3120b;
-            text-decoration: none;
-        }}
-        a:hover {{
-            text-decoration: underline;
-        }}
-        .footer {{
-            margin-top: 40px;
-            padding-top: 20px;
-            border-top: 1px solid #ddd;
-            font-size: 0.9em;
-            color: #666;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>🗞️ Your RSS Digest</h1>
-        <p><strong>{date_range}</strong></p>
-
-        {digest_html}
-
-        <div class="footer">
-            <p>This digest was automatically generated.</p>
-        </div>
-    </div>
-</body>
-</html>
-"""
+        return "".join((_HTML_PRE, date_range, _HTML_MID, digest_html, _HTML_POST))
@@ -6,26 +6,39 @@ import os
 import yaml
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional
 
 from src.core.interfaces import BasePublisher
 from src.core.models import DigestResult
 
+# libyaml's C emitter when available, keeping frontmatter in insertion order
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class FileSystemPublisher(BasePublisher):
     """Saves a DigestResult as a Markdown file with YAML frontmatter."""
 
+    __slots__ = ("output_dir",)
+
     def __init__(self, output_dir: str = "content/digests"):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-    def publish(self, digest: DigestResult, output_path: Optional[str] = None, **kwargs) -> bool:
+    def publish(
+        self,
+        digest: DigestResult,
+        output_path: Optional[str] = None,
+        backfill: bool = False,
+        **kwargs
+    ) -> bool:
         """
         Save digest as Markdown file with YAML frontmatter.
 
         Args:
             digest: The DigestResult to save
             output_path: Optional custom file path (overrides default naming)
+            backfill: Drop the written file from the page cache, for bulk
+                imports of old digests that nothing will read back soon
             **kwargs: Additional options
 
         Returns:
@@ -39,7 +52,12 @@ class FileSystemPublisher(BasePublisher):
             **digest.metadata
         }
 
-        content = f"---\n{yaml.dump(frontmatter, default_flow_style=False)}---\n\n{digest.markdown_body}"
+        parts = (
+            b"---\n",
+            yaml.dump(frontmatter, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False).encode("utf-8"),
+            b"---\n\n",
+            digest.markdown_body.encode("utf-8"),
+        )
 
         if output_path:
             file_path = Path(output_path)
@@ -50,7 +68,24 @@ class FileSystemPublisher(BasePublisher):
         # Ensure parent directory exists
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
-
+        self._write_atomic(file_path, parts, drop_cache=backfill)
         return True
+
+    @staticmethod
+    def _write_atomic(file_path: Path, parts: Iterable[bytes], drop_cache: bool = False) -> None:
+        """Write byte parts to a temp file and rename it over the target."""
+        # Site watchers (Jekyll/Hugo) must never pick up a half-written digest
+        tmp_path = file_path.with_suffix(file_path.suffix + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                for part in parts:
+                    f.write(part)
+                f.flush()
+                os.fsync(f.fileno())
+                # Pages are clean after fsync, so the kernel can drop them now
+                if drop_cache and hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
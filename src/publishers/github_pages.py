@@ -1,9 +1,11 @@
 """GitHub Pages publisher - Publishes digests to a GitHub Pages blog repository."""
 
 import os
+import re
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 import yaml
 from git import Repo
@@ -11,10 +13,21 @@ from git import Repo
 from src.core.interfaces import BasePublisher
 from src.core.models import DigestResult
 
+# Runs of anything but (Unicode) letters and digits become a single dash
+_SLUG_RE = re.compile(r"[\W_]+")
+
+# libyaml's C emitter when available, keeping frontmatter in insertion order
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class GitHubPagesPublisher(BasePublisher):
     """Publishes a DigestResult to a separate GitHub Pages repository."""
-    
+
+    __slots__ = ("repo_url", "local_clone_path", "content_dir", "_repo", "_last_sync")
+
+    # Seconds a synced clone is trusted before fetching from the remote again
+    SYNC_INTERVAL = 300.0
+
     def __init__(
         self,
         repo_url: str,
@@ -24,17 +37,60 @@ class GitHubPagesPublisher(BasePublisher):
         self.repo_url = repo_url
         self.local_clone_path = Path(local_clone_path)
         self.content_dir = content_dir
-        
+        self._repo: Optional[Repo] = None
+        self._last_sync = 0.0
+
     def _ensure_repo(self) -> Repo:
-        """Clones the repo if it doesn't exist, or pulls latest if it does."""
+        """
+        Shallow-clone the repo if it doesn't exist, or sync it if it does.
+
+        Only the tip of the default branch is ever needed to add a post, so
+        the clone and each update fetch a single commit rather than the
+        blog's full history. A clone synced within SYNC_INTERVAL is reused
+        as is, so back-to-back publishes skip the network round trip.
+        """
+        if self._repo is not None and time.monotonic() - self._last_sync < self.SYNC_INTERVAL:
+            return self._repo
+
         if self.local_clone_path.exists():
             repo = Repo(self.local_clone_path)
-            origin = repo.remotes.origin
-            origin.pull()
-            return repo
+            branch = repo.active_branch.name
+            repo.remotes.origin.fetch(branch, depth=1)
+            repo.git.reset("--hard", f"origin/{branch}")
         else:
             self.local_clone_path.parent.mkdir(parents=True, exist_ok=True)
-            return Repo.clone_from(self.repo_url, self.local_clone_path)
+            repo = Repo.clone_from(
+                self.repo_url,
+                self.local_clone_path,
+                multi_options=["--depth=1", "--single-branch"]
+            )
+
+        self._configure_repo(repo)
+        self._repo = repo
+        self._last_sync = time.monotonic()
+        return repo
+
+    def _configure_repo(self, repo: Repo) -> None:
+        """Write the clone's git settings, touching the config file only if they differ."""
+        settings = {
+            # Commit identity (required by GitHub)
+            ("user", "name"): "RSS Digest Bot",
+            ("user", "email"): "rss-digest@localhost",
+            # Keep automatic gc out of commit/push in this throwaway clone
+            ("gc", "auto"): "0",
+        }
+        reader = repo.config_reader("repository")
+        missing = {
+            key: value
+            for key, value in settings.items()
+            if str(reader.get_value(*key, default="")) != value
+        }
+        if not missing:
+            return
+
+        with repo.config_writer() as cfg:
+            for (section, option), value in missing.items():
+                cfg.set_value(section, option, value)
 
     def publish(self, digest: DigestResult, **kwargs) -> bool:
         """
@@ -44,65 +100,91 @@ class GitHubPagesPublisher(BasePublisher):
             digest: The DigestResult to publish
             **kwargs: Additional options (commit_message, layout)
         
+        Returns:
+            True if successful, False otherwise
+        """
+        kwargs.setdefault("commit_message", f"Add digest: {digest.title}")
+        return self.publish_many([digest], **kwargs)
+
+    def publish_many(self, digests: List[DigestResult], **kwargs) -> bool:
+        """
+        Publish several digests with a single commit and push.
+
+        Args:
+            digests: The DigestResults to publish
+            **kwargs: Additional options (commit_message, layout)
+
         Returns:
             True if successful, False otherwise
         """
         try:
-            repo = self._ensure_repo()
-            
-            # Configure git user for commits (required by GitHub)
-            with repo.config_writer() as cfg:
-                cfg.set_value("user", "name", "RSS Digest Bot")
-                cfg.set_value("user", "email", "rss-digest@localhost")
-            
-            # GitHub Pages (Jekyll) expects posts in _posts folder
-            # with format YYYY-MM-DD-title.md
-            posts_dir = self.local_clone_path / self.content_dir
-            posts_dir.mkdir(exist_ok=True)
-            
-            # Format filename
-            date_str = digest.date.strftime('%Y-%m-%d')
-            safe_title = "".join([c if c.isalnum() else "-" for c in digest.title]).lower()
-            # Remove consecutive dashes and trim
-            safe_title = "-".join(filter(None, safe_title.split("-")))
-            filename = f"{date_str}-{safe_title}.md"
-            file_path = posts_dir / filename
-            
-            # Build frontmatter for Jekyll
             layout = kwargs.get("layout", "post")
-            frontmatter = {
-                "layout": layout,
-                "title": digest.title,
-                "date": digest.date.isoformat(),
-                "config": digest.config_name,
-                **digest.metadata
-            }
-            
-            # Generate content with YAML frontmatter
-            content = f"---\n{yaml.dump(frontmatter, default_flow_style=False)}---\n\n{digest.markdown_body}"
-            
-            # Write file
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(content)
-                
-            # Git commit and push
-            repo.index.add([str(file_path.relative_to(self.local_clone_path))])
-            
-            commit_message = kwargs.get("commit_message", f"Add digest: {digest.title}")
-            repo.index.commit(commit_message)
-            
-            origin = repo.remotes.origin
-            push_info = origin.push()
-            
-            # Check for push errors
-            for info in push_info:
-                if info.flags & info.ERROR:
-                    print(f"Push error: {info.summary}")
-                    return False
-            
-            return True
-            
+            commit_message = kwargs.get("commit_message") or f"Add {len(digests)} digests"
+
+            # A reused clone may be behind the remote; if the push is rejected,
+            # resync and recommit on top of the latest commit once
+            errors = []
+            for _ in range(2):
+                repo = self._ensure_repo()
+                push_info = self._commit_and_push(repo, digests, layout, commit_message)
+                errors = [info for info in push_info if info.flags & info.ERROR]
+                if not errors:
+                    return True
+                # Drop the memoized clone so the retry fetches from the remote
+                self._repo = None
+
+            for info in errors:
+                print(f"Push error: {info.summary}")
+            return False
+
         except Exception as e:
             # Log error but don't crash - caller should handle
             print(f"Error publishing to GitHub Pages: {e}")
+            self._repo = None
             return False
+
+    def _commit_and_push(
+        self,
+        repo: Repo,
+        digests: List[DigestResult],
+        layout: str,
+        commit_message: str
+    ):
+        """Write the posts, commit them and push; returns the push results."""
+        # GitHub Pages (Jekyll) expects posts in _posts folder
+        # with format YYYY-MM-DD-title.md
+        posts_dir = self.local_clone_path / self.content_dir
+        posts_dir.mkdir(exist_ok=True)
+
+        file_paths = [self._write_post(posts_dir, digest, layout) for digest in digests]
+
+        # Git commit and push
+        repo.index.add([str(path.relative_to(self.local_clone_path)) for path in file_paths])
+        repo.index.commit(commit_message)
+        return repo.remotes.origin.push()
+
+    def _write_post(self, posts_dir: Path, digest: DigestResult, layout: str) -> Path:
+        """Write one digest as a Jekyll post and return its path."""
+        # Format filename
+        date_str = digest.date.strftime('%Y-%m-%d')
+        safe_title = _SLUG_RE.sub("-", digest.title.lower()).strip("-")
+        filename = f"{date_str}-{safe_title}.md"
+        file_path = posts_dir / filename
+        
+        # Build frontmatter for Jekyll
+        frontmatter = {
+            "layout": layout,
+            "title": digest.title,
+            "date": digest.date.isoformat(),
+            "config": digest.config_name,
+            **digest.metadata
+        }
+        
+        # Generate content with YAML frontmatter
+        content = f"---\n{yaml.dump(frontmatter, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)}---\n\n{digest.markdown_body}"
+        
+        # Write file
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+        return file_path
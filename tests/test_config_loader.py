@@ -0,0 +1,158 @@
+"""Tests for the config.loader module."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.config import loader
+from src.config.loader import (
+    ConfigNotFoundError,
+    clear_config_cache,
+    get_config_info,
+    list_available_configs,
+    load_config,
+)
+
+
+VALID_CONFIG = """
+name = "Test Digest"
+
+[feeds]
+"Feed A" = "https://example.com/a.xml"
+"Feed B" = "https://example.com/b.xml"
+
+[prompt]
+template = "Articles: {article_list}"
+"""
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> None:
+    """Ensure every test starts with an empty config cache."""
+    clear_config_cache()
+
+
+@pytest.fixture
+def configs_dir(tmp_path: Path) -> Path:
+    """Provide a configs directory containing a single valid config."""
+    (tmp_path / "test.toml").write_text(VALID_CONFIG, encoding="utf-8")
+    return tmp_path
+
+
+def test_load_config_parses_and_sets_defaults(configs_dir: Path) -> None:
+    """Test that a valid config is parsed and optional fields defaulted."""
+    config = load_config("test", str(configs_dir))
+
+    assert config["name"] == "Test Digest"
+    assert config["feeds"] == {
+        "Feed A": "https://example.com/a.xml",
+        "Feed B": "https://example.com/b.xml",
+    }
+    assert config["days_lookback"] == 7
+    assert config["schedule"] == "weekly"
+    assert config["email_subject"] == "Test Digest Digest"
+    assert config["sender_name"] == "Test Digest"
+
+
+def test_load_config_accepts_toml_extension(configs_dir: Path) -> None:
+    """Test that config names may include the .toml extension."""
+    assert load_config("test.toml", str(configs_dir))["name"] == "Test Digest"
+
+
+def test_load_config_missing_file(configs_dir: Path) -> None:
+    """Test that a missing config raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        load_config("does-not-exist", str(configs_dir))
+
+
+def test_load_config_missing_file_lists_available_lazily(
+    configs_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that available configs are only listed when the error is shown."""
+    calls = []
+    original_list = loader.list_available_configs
+
+    def counting_list(directory: str) -> list:
+        calls.append(directory)
+        return original_list(directory)
+
+    monkeypatch.setattr(loader, "list_available_configs", counting_list)
+
+    with pytest.raises(ConfigNotFoundError) as exc_info:
+        load_config("does-not-exist", str(configs_dir))
+    assert calls == []
+
+    assert exc_info.value.available == ["test"]
+    assert "Available configs: ['test']" in str(exc_info.value)
+
+
+def test_load_config_missing_required_fields(tmp_path: Path) -> None:
+    """Test that configs without required fields are rejected."""
+    (tmp_path / "bad.toml").write_text('description = "x"\n', encoding="utf-8")
+
+    with pytest.raises(ValueError, match="missing required fields"):
+        load_config("bad", str(tmp_path))
+
+
+def test_load_config_is_cached(configs_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that an unchanged config file is only parsed once."""
+    calls = []
+    original_load = loader.tomllib.load
+
+    def counting_load(f):
+        calls.append(f)
+        return original_load(f)
+
+    monkeypatch.setattr(loader.tomllib, "load", counting_load)
+
+    first = load_config("test", str(configs_dir))
+    second = load_config("test", str(configs_dir))
+
+    assert first == second
+    assert len(calls) == 1
+
+
+def test_load_config_returns_independent_copies(configs_dir: Path) -> None:
+    """Test that mutating a returned config does not leak into the cache."""
+    first = load_config("test", str(configs_dir))
+    first["feeds"]["Injected"] = "https://example.com/injected.xml"
+
+    second = load_config("test", str(configs_dir))
+    assert "Injected" not in second["feeds"]
+
+
+def test_load_config_reloads_modified_file(configs_dir: Path) -> None:
+    """Test that editing a config file invalidates the cached entry."""
+    config_file = configs_dir / "test.toml"
+    assert load_config("test", str(configs_dir))["name"] == "Test Digest"
+
+    config_file.write_text(
+        VALID_CONFIG.replace("Test Digest", "Renamed"), encoding="utf-8"
+    )
+    st = config_file.stat()
+    os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert load_config("test", str(configs_dir))["name"] == "Renamed"
+
+
+def test_list_available_configs(configs_dir: Path) -> None:
+    """Test listing config names without the .toml extension."""
+    (configs_dir / "other.toml").write_text(VALID_CONFIG, encoding="utf-8")
+    (configs_dir / "notes.txt").write_text("ignored", encoding="utf-8")
+
+    assert sorted(list_available_configs(str(configs_dir))) == ["other", "test"]
+
+
+def test_list_available_configs_missing_dir(tmp_path: Path) -> None:
+    """Test that a missing configs directory yields an empty list."""
+    assert list_available_configs(str(tmp_path / "missing")) == []
+
+
+def test_get_config_info(configs_dir: Path) -> None:
+    """Test config summary information."""
+    info = get_config_info("test", str(configs_dir))
+
+    assert info["name"] == "Test Digest"
+    assert info["feed_count"] == 2
+    assert info["feeds"] == ["Feed A", "Feed B"]
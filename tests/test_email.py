@@ -0,0 +1,222 @@
+"""Tests for the publishers.email module."""
+
+import os
+import smtplib
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import markdown
+import pytest
+
+from src.core.models import DigestResult
+from src.publishers.email import EmailPublisher, _render_markdown
+
+
+@pytest.fixture
+def email_publisher() -> EmailPublisher:
+    """Provide an EmailPublisher with dummy SMTP settings."""
+    return EmailPublisher(
+        smtp_host="smtp.example.com",
+        smtp_port=587,
+        smtp_username="user@example.com",
+        smtp_password="secret",
+        recipient_email="reader@example.com",
+        sender_name="Test Digest",
+    )
+
+
+@pytest.fixture
+def sample_digest() -> DigestResult:
+    """Provide a sample DigestResult for publishing."""
+    return DigestResult(
+        title="Weekly Digest",
+        date=datetime(2024, 1, 15, 12, 0, 0),
+        config_name="Test Digest",
+        sources_analyzed=5,
+        markdown_body="# Heading\n\nBody",
+    )
+
+
+def _mock_smtp_factory() -> MagicMock:
+    """Create a mock smtplib.SMTP class returning healthy connections."""
+    smtp_cls = MagicMock()
+    smtp_cls.side_effect = lambda *args, **kwargs: MagicMock(
+        noop=MagicMock(return_value=(250, b"OK"))
+    )
+    return smtp_cls
+
+
+def test_publish_opens_and_closes_connection(
+    email_publisher: EmailPublisher, sample_digest: DigestResult
+) -> None:
+    """Test that a one-off publish closes its SMTP connection."""
+    server = MagicMock()
+    with patch("src.publishers.email.smtplib.SMTP", return_value=server) as smtp_cls:
+        assert email_publisher.publish(sample_digest, template_path=None)
+
+    smtp_cls.assert_called_once_with("smtp.example.com", 587, timeout=30.0)
+    server.starttls.assert_called_once()
+    server.login.assert_called_once_with("user@example.com", "secret")
+    server.send_message.assert_called_once()
+    server.quit.assert_called_once()
+    assert email_publisher._server is None
+
+    msg = server.send_message.call_args[0][0]
+    assert msg["From"] == "Test Digest <user@example.com>"
+    assert msg["To"] == "reader@example.com"
+    assert msg["Subject"] == "Weekly Digest: Jan 15, 2024 (5 articles)"
+    assert msg.get_content_type() == "text/html"
+    assert "<h1>Heading</h1>" in msg.get_content()
+
+
+def test_publish_reuses_connection_in_context(
+    email_publisher: EmailPublisher, sample_digest: DigestResult
+) -> None:
+    """Test that sends inside a with-block share one SMTP connection."""
+    with patch("src.publishers.email.smtplib.SMTP", _mock_smtp_factory()) as smtp_cls:
+        with email_publisher as publisher:
+            assert publisher.publish(sample_digest, template_path=None)
+            assert publisher.publish(sample_digest, template_path=None)
+            server = publisher._server
+
+        assert smtp_cls.call_count == 1
+        assert server.login.call_count == 1
+        assert server.send_message.call_count == 2
+        server.quit.assert_called_once()
+        assert email_publisher._server is None
+
+
+def test_publish_sender_name_override(
+    email_publisher: EmailPublisher, sample_digest: DigestResult
+) -> None:
+    """Test that a per-message sender name replaces the default display name."""
+    server = MagicMock()
+    with patch("src.publishers.email.smtplib.SMTP", return_value=server):
+        assert email_publisher.publish(sample_digest, template_path=None, sender_name="AI Weekly")
+
+    msg = server.send_message.call_args[0][0]
+    assert msg["From"] == "AI Weekly <user@example.com>"
+
+
+def test_publish_reconnects_stale_connection(
+    email_publisher: EmailPublisher, sample_digest: DigestResult
+) -> None:
+    """Test that a connection failing NOOP is replaced before sending."""
+    with patch("src.publishers.email.smtplib.SMTP", _mock_smtp_factory()) as smtp_cls:
+        with email_publisher as publisher:
+            assert publisher.publish(sample_digest, template_path=None)
+            stale = publisher._server
+            stale.noop.side_effect = smtplib.SMTPServerDisconnected("gone")
+
+            assert publisher.publish(sample_digest, template_path=None)
+
+            assert smtp_cls.call_count == 2
+            assert publisher._server is not stale
+            assert stale.send_message.call_count == 1
+            assert publisher._server.send_message.call_count == 1
+
+
+def test_publish_retries_transient_smtp_error(
+    email_publisher: EmailPublisher, sample_digest: DigestResult
+) -> None:
+    """Test that a 4xx reply is retried once on a fresh connection."""
+    first, second = MagicMock(), MagicMock()
+    first.send_message.side_effect = smtplib.SMTPDataError(421, b"try again later")
+    with patch("src.publishers.email.smtplib.SMTP", side_effect=[first, second]):
+        assert email_publisher.publish(sample_digest, template_path=None)
+
+    first.quit.assert_called_once()
+    second.send_message.assert_called_once()
+
+
+def test_publish_does_not_retry_permanent_smtp_error(
+    email_publisher: EmailPublisher, sample_digest: DigestResult
+) -> None:
+    """Test that a 5xx reply fails the publish without reconnecting."""
+    server = MagicMock()
+    server.send_message.side_effect = smtplib.SMTPDataError(554, b"rejected")
+    with patch("src.publishers.email.smtplib.SMTP", return_value=server) as smtp_cls:
+        assert not email_publisher.publish(sample_digest, template_path=None)
+
+    smtp_cls.assert_called_once()
+
+
+def test_render_markdown_matches_markdown_and_is_memoized() -> None:
+    """Test that the shared converter renders like markdown.markdown and caches."""
+    _render_markdown.cache_clear()
+    bodies = ["# Heading\n\n[link](https://example.com)", "* one\n* two", "<h2>Raw HTML</h2>"]
+
+    for body in bodies:
+        assert _render_markdown(body) == markdown.markdown(body)
+    _render_markdown(bodies[0])
+
+    assert _render_markdown.cache_info().hits == 1
+
+
+def test_simple_template_injects_content(email_publisher: EmailPublisher) -> None:
+    """Test that the fallback template contains the date range and digest."""
+    html = email_publisher._create_simple_template("<p>Digest body</p>", "Jan 15, 2024")
+
+    assert html.lstrip().startswith("<!DOCTYPE html>")
+    assert "<p><strong>Jan 15, 2024</strong></p>" in html
+    assert "<p>Digest body</p>" in html
+    assert html.index("Jan 15, 2024") < html.index("<p>Digest body</p>")
+    assert "{{" not in html and "}}" not in html
+
+
+def test_load_template_from_file(email_publisher: EmailPublisher, tmp_path: Path) -> None:
+    """Test that placeholders in a template file are replaced."""
+    template = tmp_path / "template.html"
+    template.write_text(
+        "<h1>{{DATE_RANGE}}</h1><div>{{DIGEST_CONTENT}}</div>", encoding="utf-8"
+    )
+
+    html = email_publisher._load_template(str(template), "<p>Body</p>", "Jan 15, 2024")
+
+    assert html == "<h1>Jan 15, 2024</h1><div><p>Body</p></div>"
+
+
+def test_load_template_is_read_once_until_modified(
+    email_publisher: EmailPublisher, tmp_path: Path
+) -> None:
+    """Test that template files are cached until their mtime changes."""
+    template = tmp_path / "template.html"
+    template.write_text("<div>{{DIGEST_CONTENT}}</div>", encoding="utf-8")
+
+    with patch("builtins.open", wraps=open) as mock_open:
+        email_publisher._load_template(str(template), "a", "Jan 15, 2024")
+        email_publisher._load_template(str(template), "b", "Jan 15, 2024")
+    assert mock_open.call_count == 1
+
+    template.write_text("<p>{{DIGEST_CONTENT}} {{DATE_RANGE}}</p>", encoding="utf-8")
+    stat = template.stat()
+    os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    html = email_publisher._load_template(str(template), "{{DATE_RANGE}}", "Jan 15, 2024")
+    assert html == "<p>{{DATE_RANGE}} Jan 15, 2024</p>"
+
+
+def test_template_cache_is_shared_across_publishers(
+    email_publisher: EmailPublisher, tmp_path: Path
+) -> None:
+    """Test that a second publisher reuses the template already read by the first."""
+    template = tmp_path / "template.html"
+    template.write_text("<div>{{DIGEST_CONTENT}}</div>", encoding="utf-8")
+    other = EmailPublisher("smtp.example.com", 587, "user", "secret", "reader@example.com")
+
+    with patch("builtins.open", wraps=open) as mock_open:
+        email_publisher._load_template(str(template), "a", "Jan 15, 2024")
+        assert other._load_template(str(template), "b", "Jan 15, 2024") == "<div>b</div>"
+    assert mock_open.call_count == 1
+
+
+def test_load_template_missing_file_falls_back(
+    email_publisher: EmailPublisher, tmp_path: Path
+) -> None:
+    """Test that a missing template file falls back to the simple template."""
+    html = email_publisher._load_template(
+        str(tmp_path / "missing.html"), "<p>Body</p>", "Jan 15, 2024"
+    )
+
+    assert html == email_publisher._create_simple_template("<p>Body</p>", "Jan 15, 2024")
@@ -0,0 +1,58 @@
+"""Tests for the config.env module."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.config import env
+from src.config.env import load_env
+
+
+@pytest.fixture(autouse=True)
+def _clean_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Isolate os.environ and the .env cache for each test."""
+    monkeypatch.setattr(env, "_ENV_CACHE", {})
+    monkeypatch.delenv("RSS_DIGEST_TEST_VAR", raising=False)
+
+
+def test_load_env_sets_and_overrides(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that values from the .env file override existing variables."""
+    dotenv_file = tmp_path / ".env"
+    dotenv_file.write_text("RSS_DIGEST_TEST_VAR=from-file\n", encoding="utf-8")
+    monkeypatch.setenv("RSS_DIGEST_TEST_VAR", "from-shell")
+
+    load_env(str(dotenv_file))
+
+    assert os.environ["RSS_DIGEST_TEST_VAR"] == "from-file"
+
+
+def test_load_env_missing_file(tmp_path: Path) -> None:
+    """Test that a missing .env file is ignored."""
+    load_env(str(tmp_path / ".env"))
+
+    assert "RSS_DIGEST_TEST_VAR" not in os.environ
+
+
+def test_load_env_reuses_parsed_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that an unchanged .env file is parsed only once."""
+    import dotenv
+
+    dotenv_file = tmp_path / ".env"
+    dotenv_file.write_text("RSS_DIGEST_TEST_VAR=cached\n", encoding="utf-8")
+
+    calls = []
+    original_values = dotenv.dotenv_values
+
+    def counting_values(*args, **kwargs):
+        calls.append(args)
+        return original_values(*args, **kwargs)
+
+    monkeypatch.setattr(dotenv, "dotenv_values", counting_values)
+
+    load_env(str(dotenv_file))
+    monkeypatch.setenv("RSS_DIGEST_TEST_VAR", "changed-in-between")
+    load_env(str(dotenv_file))
+
+    assert len(calls) == 1
+    assert os.environ["RSS_DIGEST_TEST_VAR"] == "cached"
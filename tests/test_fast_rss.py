@@ -0,0 +1,132 @@
+"""Tests for the fast RSS/Atom extractor."""
+
+from xml.etree.ElementTree import ParseError
+
+import feedparser
+import pytest
+
+from src.fetchers._fast_rss import fast_parse, sniff_feed_type
+
+
+def test_fast_parse_rss2() -> None:
+    """Test extracting items from an RSS 2.0 feed."""
+    body = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Feed</title>
+<item>
+  <title> First &amp; Best </title>
+  <link>https://example.com/first</link>
+  <description><![CDATA[<p>Summary</p>]]></description>
+  <pubDate>Mon, 15 Jan 2024 12:00:00 GMT</pubDate>
+</item>
+<item>
+  <title>Guid Only</title>
+  <atom:link xmlns:atom="http://www.w3.org/2005/Atom" href="https://example.com/self" rel="self"/>
+  <guid>https://example.com/guid</guid>
+</item>
+</channel></rss>"""
+
+    entries = fast_parse(body)
+
+    assert entries == [
+        {
+            "title": "First & Best",
+            "link": "https://example.com/first",
+            "summary": "<p>Summary</p>",
+            "published": "Mon, 15 Jan 2024 12:00:00 GMT",
+        },
+        {"title": "Guid Only", "link": "https://example.com/guid"},
+    ]
+
+
+def test_fast_parse_atom() -> None:
+    """Test extracting entries from an Atom feed."""
+    body = b"""<?xml version="1.0"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>Feed</title>
+<entry>
+  <title>Atom Entry</title>
+  <link rel="self" href="https://example.com/self"/>
+  <link href="https://example.com/atom"/>
+  <updated>2024-01-15T12:00:00Z</updated>
+  <content type="html">&lt;p&gt;Body&lt;/p&gt;</content>
+</entry>
+</feed>"""
+
+    assert fast_parse(body) == [
+        {
+            "title": "Atom Entry",
+            "link": "https://example.com/atom",
+            "updated": "2024-01-15T12:00:00Z",
+            "summary": "<p>Body</p>",
+        }
+    ]
+
+
+def test_fast_parse_rss1() -> None:
+    """Test extracting items from an RSS 1.0 (RDF) feed."""
+    body = b"""<?xml version="1.0"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns="http://purl.org/rss/1.0/"
+         xmlns:dc="http://purl.org/dc/elements/1.1/">
+<channel><title>Feed</title></channel>
+<item><title>RDF Item</title><link>https://example.com/rdf</link>
+<dc:date>2024-01-15T12:00:00Z</dc:date></item>
+</rdf:RDF>"""
+
+    assert fast_parse(body) == [
+        {"title": "RDF Item", "link": "https://example.com/rdf", "updated": "2024-01-15T12:00:00Z"}
+    ]
+
+
+def test_fast_parse_rss_content_encoded_matches_feedparser() -> None:
+    """Test that content:encoded stands in for a missing description, as in feedparser."""
+    body = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/"><channel><title>Feed</title>
+<item>
+  <title>Full Text</title>
+  <link>https://example.com/full</link>
+  <content:encoded><![CDATA[<p>Full body</p>]]></content:encoded>
+</item>
+<item>
+  <title>Both</title>
+  <link>https://example.com/both</link>
+  <description>Short</description>
+  <content:encoded><![CDATA[<p>Full body</p>]]></content:encoded>
+</item>
+</channel></rss>"""
+
+    expected = feedparser.parse(body, resolve_relative_uris=False, sanitize_html=False).entries
+
+    assert [e["summary"] for e in fast_parse(body)] == [e.summary for e in expected]
+    assert fast_parse(body)[0]["summary"] == "<p>Full body</p>"
+
+
+@pytest.mark.parametrize(
+    ("body", "error"),
+    [
+        (b"", ValueError),
+        (b"<rss><channel><item>", ParseError),
+        (b"<rss><channel><item><title>&nbsp;</title></item></channel></rss>", ParseError),
+        (b"<html><body></body></html>", ValueError),
+        # Sniffed as RSS from the comment, but the root is an Atom feed
+        (b'<!-- <rss --><feed xmlns="http://www.w3.org/2005/Atom"><entry/></feed>', ValueError),
+    ],
+)
+def test_fast_parse_rejects_unsupported_documents(body: bytes, error: type) -> None:
+    """Test that malformed or non-feed documents raise for the feedparser fallback."""
+    with pytest.raises(error):
+        fast_parse(body)
+
+
+@pytest.mark.parametrize(
+    ("body", "expected"),
+    [
+        (b'<?xml version="1.0"?>\n<rss version="2.0"><channel/></rss>', "rss"),
+        (b'<?xml version="1.0"?><rdf:RDF xmlns:rdf="x"/>', "rss"),
+        (b'<feed xmlns="http://www.w3.org/2005/Atom"/>', "atom"),
+        (b"<html><body></body></html>", None),
+        (b"<!-- " + b"x" * 600 + b" --><rss/>", None),
+    ],
+)
+def test_sniff_feed_type(body: bytes, expected: str) -> None:
+    """Test that the feed format is detected from the document head."""
+    assert sniff_feed_type(body) == expected
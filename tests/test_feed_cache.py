@@ -0,0 +1,38 @@
+"""Tests for the feed cache module."""
+
+from pathlib import Path
+
+from src.fetchers.feed_cache import FeedCache
+
+
+def test_store_and_load_roundtrip(tmp_path: Path) -> None:
+    """Test that a stored feed is loaded back with its headers."""
+    cache = FeedCache(tmp_path / "feeds")
+    headers = {"etag": '"abc"', "content-type": "application/rss+xml"}
+
+    cache.store("https://example.com/feed.xml", b"<rss></rss>", headers)
+
+    assert cache.load("https://example.com/feed.xml") == (b"<rss></rss>", headers)
+    assert cache.load("https://example.com/other.xml") is None
+    assert not list((tmp_path / "feeds").glob("*.tmp"))
+
+
+def test_load_ignores_corrupt_metadata(tmp_path: Path) -> None:
+    """Test that an unreadable cache entry is treated as a miss."""
+    cache = FeedCache(tmp_path)
+    cache.store("https://example.com/feed.xml", b"<rss></rss>", {"etag": '"abc"'})
+    _, meta_path = cache._paths("https://example.com/feed.xml")
+    meta_path.write_text("{not json", encoding="utf-8")
+
+    assert cache.load("https://example.com/feed.xml") is None
+
+
+def test_conditional_headers() -> None:
+    """Test building validator headers from cached response headers."""
+    assert FeedCache.conditional_headers(
+        {"etag": '"abc"', "last-modified": "Mon, 15 Jan 2024 12:00:00 GMT"}
+    ) == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Mon, 15 Jan 2024 12:00:00 GMT",
+    }
+    assert FeedCache.conditional_headers({"content-type": "text/xml"}) == {}
@@ -0,0 +1,82 @@
+"""Tests for the publishers.file_system module."""
+
+import os
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.commands.publish_cmd import parse_frontmatter
+from src.core.models import DigestResult
+from src.publishers.file_system import FileSystemPublisher
+
+
+def test_publish_writes_frontmatter_in_field_order(tmp_path: Path) -> None:
+    """Test that the saved digest keeps frontmatter order and round-trips."""
+    digest = DigestResult(
+        title="Weekly Digest",
+        date=datetime(2024, 1, 15, 12, 0, 0),
+        config_name="Test Digest",
+        sources_analyzed=5,
+        markdown_body="<p>Body</p>",
+        metadata={"model": "test-model", "total_tokens": 123},
+    )
+
+    assert FileSystemPublisher(output_dir=str(tmp_path)).publish(digest)
+
+    file_path = tmp_path / "2024-01-15-test-digest.md"
+    content = file_path.read_text(encoding="utf-8")
+    assert content.startswith(
+        "---\n"
+        "title: Weekly Digest\n"
+        "date: '2024-01-15T12:00:00'\n"
+        "config: Test Digest\n"
+        "sources_analyzed: 5\n"
+        "model: test-model\n"
+        "total_tokens: 123\n"
+        "---\n\n"
+    )
+
+    frontmatter, body = parse_frontmatter(file_path.read_bytes())
+    assert frontmatter["sources_analyzed"] == 5
+    assert body.strip() == "<p>Body</p>"
+
+
+def test_publish_replaces_existing_file_atomically(tmp_path: Path) -> None:
+    """Test that republishing overwrites the digest and leaves no temp file."""
+    file_path = tmp_path / "digest.md"
+    file_path.write_text("stale", encoding="utf-8")
+    digest = DigestResult(
+        title="Digest",
+        date=datetime(2024, 1, 15),
+        config_name="Test",
+        sources_analyzed=1,
+        markdown_body="<p>Fresh ü</p>",
+    )
+
+    assert FileSystemPublisher(output_dir=str(tmp_path)).publish(digest, output_path=str(file_path))
+
+    assert file_path.read_text(encoding="utf-8").endswith("---\n\n<p>Fresh ü</p>")
+    assert list(tmp_path.iterdir()) == [file_path]
+
+
+@pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="posix_fadvise unavailable")
+@pytest.mark.parametrize("backfill", [False, True])
+def test_publish_backfill_drops_page_cache(tmp_path: Path, backfill: bool) -> None:
+    """Test that only backfill writes advise the kernel to drop cached pages."""
+    digest = DigestResult(
+        title="Digest",
+        date=datetime(2024, 1, 15),
+        config_name="Test",
+        sources_analyzed=1,
+        markdown_body="<p>Body</p>",
+    )
+
+    with patch("src.publishers.file_system.os.posix_fadvise") as mock_fadvise:
+        assert FileSystemPublisher(output_dir=str(tmp_path)).publish(digest, backfill=backfill)
+
+    assert mock_fadvise.called is backfill
+    if backfill:
+        assert mock_fadvise.call_args.args[1:] == (0, 0, os.POSIX_FADV_DONTNEED)
+    assert (tmp_path / "2024-01-15-test.md").read_text(encoding="utf-8").endswith("<p>Body</p>")
@@ -0,0 +1,191 @@
+"""Tests for the publishers.github_pages module."""
+
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from git import Repo
+
+from src.core.models import DigestResult
+from src.publishers.github_pages import GitHubPagesPublisher
+
+
+@pytest.fixture
+def origin_repo(tmp_path: Path) -> Repo:
+    """Provide a bare blog repository with a few commits of history."""
+    work = Repo.init(tmp_path / "work", initial_branch="main")
+    with work.config_writer() as cfg:
+        cfg.set_value("user", "name", "Test")
+        cfg.set_value("user", "email", "test@example.com")
+    for i in range(3):
+        (tmp_path / "work" / "index.md").write_text(f"version {i}\n", encoding="utf-8")
+        work.index.add(["index.md"])
+        work.index.commit(f"Commit {i}")
+
+    origin = Repo.init(tmp_path / "origin.git", bare=True, initial_branch="main")
+    work.create_remote("origin", str(origin.working_dir)).push("main")
+    return origin
+
+
+@pytest.fixture
+def sample_digest() -> DigestResult:
+    """Provide a sample DigestResult for publishing."""
+    return DigestResult(
+        title="Weekly Digest",
+        date=datetime(2024, 1, 15, 12, 0, 0),
+        config_name="Test Digest",
+        sources_analyzed=5,
+        markdown_body="<p>Body</p>",
+    )
+
+
+def test_publish_uses_shallow_clone_and_pushes(
+    origin_repo: Repo, sample_digest: DigestResult, tmp_path: Path
+) -> None:
+    """Test that the blog is cloned shallowly and the post reaches the remote."""
+    clone_path = tmp_path / "clone"
+    publisher = GitHubPagesPublisher(repo_url=Path(origin_repo.working_dir).as_uri(), local_clone_path=str(clone_path))
+
+    assert publisher.publish(sample_digest)
+
+    clone = Repo(clone_path)
+    assert clone.git.rev_parse("--is-shallow-repository") == "true"
+    assert origin_repo.head.commit.message == "Add digest: Weekly Digest"
+    assert "_posts/2024-01-15-weekly-digest.md" in [
+        blob.path for blob in origin_repo.head.commit.tree.traverse()
+    ]
+
+
+def test_existing_clone_is_synced_to_remote(
+    origin_repo: Repo, sample_digest: DigestResult, tmp_path: Path
+) -> None:
+    """Test that an existing clone picks up commits pushed by someone else."""
+    clone_path = tmp_path / "clone"
+    publisher = GitHubPagesPublisher(repo_url=Path(origin_repo.working_dir).as_uri(), local_clone_path=str(clone_path))
+    publisher._ensure_repo()
+
+    other = Repo.clone_from(origin_repo.working_dir, tmp_path / "other")
+    with other.config_writer() as cfg:
+        cfg.set_value("user", "name", "Other")
+        cfg.set_value("user", "email", "other@example.com")
+    (tmp_path / "other" / "about.md").write_text("about\n", encoding="utf-8")
+    other.index.add(["about.md"])
+    other.index.commit("Add about page")
+    other.remotes.origin.push()
+
+    assert publisher.publish(sample_digest)
+
+    assert (clone_path / "about.md").exists()
+    assert origin_repo.head.commit.parents[0].message == "Add about page"
+
+
+def test_publish_many_uses_one_commit(
+    origin_repo: Repo, sample_digest: DigestResult, tmp_path: Path
+) -> None:
+    """Test that several digests are pushed as a single commit."""
+    publisher = GitHubPagesPublisher(
+        repo_url=Path(origin_repo.working_dir).as_uri(), local_clone_path=str(tmp_path / "clone")
+    )
+    daily = DigestResult(
+        title="Daily Digest",
+        date=datetime(2024, 1, 16, 7, 0, 0),
+        config_name="Tech Daily",
+        sources_analyzed=3,
+        markdown_body="<p>Daily</p>",
+    )
+    before = origin_repo.head.commit
+
+    assert publisher.publish_many([sample_digest, daily])
+
+    head = origin_repo.head.commit
+    assert head.parents == (before,)
+    assert head.message == "Add 2 digests"
+    assert set(head.stats.files) == {
+        "_posts/2024-01-15-weekly-digest.md",
+        "_posts/2024-01-16-daily-digest.md",
+    }
+
+
+def test_recently_synced_clone_is_reused(
+    origin_repo: Repo, sample_digest: DigestResult, tmp_path: Path
+) -> None:
+    """Test that back-to-back publishes don't fetch again."""
+    publisher = GitHubPagesPublisher(
+        repo_url=Path(origin_repo.working_dir).as_uri(), local_clone_path=str(tmp_path / "clone")
+    )
+    repo = publisher._ensure_repo()
+
+    with patch("src.publishers.github_pages.Repo") as mock_repo:
+        assert publisher._ensure_repo() is repo
+        publisher._last_sync -= GitHubPagesPublisher.SYNC_INTERVAL
+        publisher._ensure_repo()
+
+    mock_repo.assert_called_once_with(publisher.local_clone_path)
+
+
+def test_publish_resyncs_stale_clone_after_rejected_push(
+    origin_repo: Repo, sample_digest: DigestResult, tmp_path: Path
+) -> None:
+    """Test that a push rejected from a stale memoized clone is retried after a real resync."""
+    publisher = GitHubPagesPublisher(
+        repo_url=Path(origin_repo.working_dir).as_uri(), local_clone_path=str(tmp_path / "clone")
+    )
+
+    # A freshly booted host: the monotonic clock is still below SYNC_INTERVAL
+    with patch("src.publishers.github_pages.time.monotonic", return_value=100.0):
+        publisher._ensure_repo()
+
+        other = Repo.clone_from(origin_repo.working_dir, tmp_path / "other")
+        with other.config_writer() as cfg:
+            cfg.set_value("user", "name", "Other")
+            cfg.set_value("user", "email", "other@example.com")
+        (tmp_path / "other" / "about.md").write_text("about\n", encoding="utf-8")
+        other.index.add(["about.md"])
+        other.index.commit("Add about page")
+        other.remotes.origin.push()
+
+        assert publisher.publish(sample_digest)
+
+    assert origin_repo.head.commit.message == "Add digest: Weekly Digest"
+    assert origin_repo.head.commit.parents[0].message == "Add about page"
+
+
+@pytest.mark.parametrize(
+    ("title", "expected"),
+    [
+        ("AI Weekly Digest", "2024-01-15-ai-weekly-digest.md"),
+        ("  Café & Crème: 2024!! ", "2024-01-15-café-crème-2024.md"),
+        ("snake_case--Title", "2024-01-15-snake-case-title.md"),
+    ],
+)
+def test_write_post_slugifies_title(
+    sample_digest: DigestResult, tmp_path: Path, title: str, expected: str
+) -> None:
+    """Test that post filenames keep letters and digits and collapse the rest."""
+    digest = DigestResult(
+        title=title,
+        date=sample_digest.date,
+        config_name=sample_digest.config_name,
+        sources_analyzed=sample_digest.sources_analyzed,
+        markdown_body=sample_digest.markdown_body,
+    )
+    publisher = GitHubPagesPublisher(repo_url="unused")
+
+    assert publisher._write_post(tmp_path, digest, "post").name == expected
+
+
+def test_clone_is_configured_once(origin_repo: Repo, tmp_path: Path) -> None:
+    """Test that the commit identity and gc settings are written only when missing."""
+    publisher = GitHubPagesPublisher(
+        repo_url=Path(origin_repo.working_dir).as_uri(), local_clone_path=str(tmp_path / "clone")
+    )
+    repo = publisher._ensure_repo()
+
+    reader = repo.config_reader("repository")
+    assert reader.get_value("user", "name") == "RSS Digest Bot"
+    assert reader.get_value("gc", "auto") == 0
+
+    with patch.object(Repo, "config_writer") as mock_writer:
+        publisher._configure_repo(repo)
+    mock_writer.assert_not_called()
@@ -1,12 +1,16 @@
 """Tests for the core.interfaces module."""
 
 from abc import ABC
+from pathlib import Path
 from typing import List
 
 import pytest
 
 from src.core.interfaces import BaseFetcher, BasePublisher
 from src.core.models import ContentItem, DigestResult
+from src.publishers.email import EmailPublisher
+from src.publishers.file_system import FileSystemPublisher
+from src.publishers.github_pages import GitHubPagesPublisher
 
 
 class TestFetcher(BaseFetcher):
@@ -111,3 +115,16 @@ def test_base_publisher_method_signature() -> None:
     assert "digest" in params
     assert "kwargs" in params
     assert params["kwargs"].kind == inspect.Parameter.VAR_KEYWORD
+
+
+@pytest.mark.parametrize(
+    "publisher",
+    [
+        pytest.param(lambda tmp: EmailPublisher("smtp.example.com", 587, "u", "p", "r@example.com"), id="email"),
+        pytest.param(lambda tmp: GitHubPagesPublisher("git@example.com:blog.git"), id="github_pages"),
+        pytest.param(lambda tmp: FileSystemPublisher(str(tmp)), id="file_system"),
+    ],
+)
+def test_publishers_use_slots(publisher, tmp_path: Path) -> None:
+    """Test that the concrete publishers carry no per-instance __dict__."""
+    assert not hasattr(publisher(tmp_path), "__dict__")
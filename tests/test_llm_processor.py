@@ -0,0 +1,240 @@
+"""Tests for the llm_processor module."""
+
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.models import ContentItem, DigestResult
+from src.llm_processor import DEFAULT_SYSTEM_PROMPT, LLMProcessor
+
+
+@pytest.fixture
+def sample_items() -> List[ContentItem]:
+    """Provide a few ContentItems, two of them published on the same day."""
+    return [
+        ContentItem(
+            title="First Article",
+            url="https://example.com/first",
+            content="First content",
+            source="Feed A",
+            published_date=datetime(2024, 1, 15, 8, 0, 0),
+        ),
+        ContentItem(
+            title="Second Article",
+            url="https://example.com/second",
+            content="Second content",
+            source="Feed B",
+            published_date=datetime(2024, 1, 15, 18, 0, 0),
+        ),
+        ContentItem(
+            title="Undated Article",
+            url="https://example.com/undated",
+            content="",
+            source="Feed B",
+        ),
+    ]
+
+
+@pytest.fixture
+def llm_processor() -> LLMProcessor:
+    """Provide an LLMProcessor whose OpenAI client is mocked out."""
+    processor = LLMProcessor(api_key="test-key", model="test-model")
+    processor.client = MagicMock()
+    processor.client.chat.completions.create.side_effect = lambda **kwargs: iter(
+        [
+            _chunk("  <h2>Dig"),
+            _chunk("est</h2>  "),
+            _chunk(None),
+            SimpleNamespace(choices=[], usage=SimpleNamespace(total_tokens=123)),
+        ]
+    )
+    return processor
+
+
+def _chunk(content: Optional[str]) -> SimpleNamespace:
+    """Build a streamed completion chunk carrying a content delta."""
+    delta = SimpleNamespace(content=content)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta)], usage=None)
+
+
+def test_client_retries_transient_errors() -> None:
+    """Test that the OpenAI client is configured to retry with backoff."""
+    assert LLMProcessor(api_key="test-key", model="test-model").client.max_retries == 5
+    assert LLMProcessor(api_key="test-key", model="test-model", max_retries=1).client.max_retries == 1
+
+
+def test_warm_up_opens_connection_and_ignores_errors(llm_processor: LLMProcessor) -> None:
+    """Test that warm-up makes one cheap request and never raises."""
+    llm_processor.warm_up()
+    llm_processor.client.with_options.assert_called_once_with(max_retries=0, timeout=5.0)
+    llm_processor.client.with_options.return_value.models.list.assert_called_once()
+
+    llm_processor.client.with_options.return_value.models.list.side_effect = ConnectionError("offline")
+    llm_processor.warm_up()
+
+
+def test_format_items_for_prompt(
+    llm_processor: LLMProcessor, sample_items: List[ContentItem]
+) -> None:
+    """Test the article list handed to the LLM."""
+    text = llm_processor._format_items_for_prompt(sample_items)
+
+    articles = text.split("\n\n---\n\n")
+    assert len(articles) == 3
+    assert articles[0] == (
+        "Article 1:\n"
+        "Title: First Article\n"
+        "URL: https://example.com/first\n"
+        "Source: Feed A\n"
+        "Published: 2024-01-15\n"
+        "Content: First content"
+    )
+    assert "Published: 2024-01-15" in articles[1]
+    assert "Published: Unknown" in articles[2]
+    assert "Content: No content available" in articles[2]
+
+
+def test_process_returns_digest(
+    llm_processor: LLMProcessor, sample_items: List[ContentItem]
+) -> None:
+    """Test that process builds the prompt and wraps the LLM response."""
+    now = datetime(2024, 1, 20, 9, 30, 0)
+
+    digest = llm_processor.process(
+        items=sample_items,
+        prompt_template="{article_count} articles, {date_range}:\n{article_list}",
+        config_name="Test Config",
+        now=now,
+    )
+
+    assert isinstance(digest, DigestResult)
+    assert digest.title == "Test Config Digest"
+    assert digest.date == now
+    assert digest.sources_analyzed == 3
+    assert digest.markdown_body == "<h2>Digest</h2>"
+    assert digest.metadata == {"model": "test-model", "total_tokens": 123}
+    assert llm_processor.get_token_usage_summary() == {"total_tokens": 123, "cached_tokens": 0}
+
+    kwargs = llm_processor.client.chat.completions.create.call_args.kwargs
+    assert kwargs["stream"] is True
+    assert kwargs["stream_options"] == {"include_usage": True}
+    assert kwargs["messages"][0] == {"role": "system", "content": DEFAULT_SYSTEM_PROMPT}
+    prompt = kwargs["messages"][-1]["content"]
+    assert prompt.startswith("3 articles, Jan 13 - Jan 20, 2024:\nArticle 1:")
+
+
+def test_process_uses_system_prompt_and_tracks_cached_tokens(
+    llm_processor: LLMProcessor, sample_items: List[ContentItem]
+) -> None:
+    """Test that static instructions go in the system message and cache hits are counted."""
+    usage = SimpleNamespace(
+        total_tokens=500,
+        prompt_tokens_details=SimpleNamespace(cached_tokens=384),
+    )
+    llm_processor.client.chat.completions.create.side_effect = lambda **kwargs: iter(
+        [_chunk("<p>Digest</p>"), SimpleNamespace(choices=[], usage=usage)]
+    )
+
+    llm_processor.process(
+        items=sample_items,
+        prompt_template="ARTICLES ({article_count}):\n{article_list}",
+        config_name="Test Config",
+        system_prompt="Static instructions",
+    )
+
+    messages = llm_processor.client.chat.completions.create.call_args.kwargs["messages"]
+    assert messages[0] == {"role": "system", "content": "Static instructions"}
+    assert messages[1]["content"].startswith("ARTICLES (3):\nArticle 1:")
+    assert llm_processor.get_token_usage_summary() == {"total_tokens": 500, "cached_tokens": 384}
+
+
+def test_process_without_items(llm_processor: LLMProcessor) -> None:
+    """Test that no digest is generated for an empty item list."""
+    assert llm_processor.process(items=[], prompt_template="{article_list}", config_name="x") is None
+    llm_processor.client.chat.completions.create.assert_not_called()
+
+
+def test_process_keeps_braces_in_article_content(llm_processor: LLMProcessor) -> None:
+    """Test that braces in article content are not treated as placeholders."""
+    items = [
+        ContentItem(
+            title="Templates {like} this",
+            url="https://example.com/braces",
+            content="function() { return {}; }",
+            source="Feed A",
+        )
+    ]
+
+    digest = llm_processor.process(
+        items=items,
+        prompt_template="Articles ({article_count}):\n{article_list}\nEnd of {date_range}",
+        config_name="Test Config",
+        now=datetime(2024, 1, 20),
+    )
+
+    assert digest is not None
+    prompt = llm_processor.client.chat.completions.create.call_args.kwargs["messages"][-1]["content"]
+    assert prompt.startswith("Articles (1):\nArticle 1:\nTitle: Templates {like} this\n")
+    assert "Content: function() { return {}; }\nEnd of Jan 13 - Jan 20, 2024" in prompt
+
+
+def test_process_rejects_stream_without_content(
+    sample_items: List[ContentItem], tmp_path: Path
+) -> None:
+    """Test that a stream carrying only usage fails instead of caching an empty digest."""
+    processor = LLMProcessor(api_key="test-key", model="test-model", cache_dir=tmp_path)
+    processor.client = MagicMock()
+    processor.client.chat.completions.create.side_effect = lambda **kwargs: iter(
+        [SimpleNamespace(choices=[], usage=SimpleNamespace(total_tokens=42))]
+    )
+
+    assert processor.process(sample_items, "{article_list}", "Test Config") is None
+    assert processor.total_tokens_used == 42
+    assert not list(tmp_path.glob("*.html"))
+
+
+def test_process_reuses_cached_digest(sample_items: List[ContentItem], tmp_path: Path) -> None:
+    """Test that identical inputs are answered from the digest cache."""
+    processor = LLMProcessor(api_key="test-key", model="test-model", cache_dir=tmp_path)
+    processor.client = MagicMock()
+    processor.client.chat.completions.create.side_effect = lambda **kwargs: iter(
+        [_chunk("<p>Digest</p>")]
+    )
+    now = datetime(2024, 1, 20, 9, 30, 0)
+
+    first = processor.process(sample_items, "{article_list}", "Test Config", now=now)
+    second = processor.process(sample_items, "{article_list}", "Test Config", now=now)
+
+    assert first.markdown_body == second.markdown_body == "<p>Digest</p>"
+    assert processor.client.chat.completions.create.call_count == 1
+    assert (processor.cache_hits, processor.cache_misses) == (1, 1)
+
+    # A different prompt is a different cache entry
+    processor.process(sample_items, "Other: {article_list}", "Test Config", now=now)
+    assert processor.client.chat.completions.create.call_count == 2
+
+
+def test_process_ignores_expired_cached_digest(
+    sample_items: List[ContentItem], tmp_path: Path
+) -> None:
+    """Test that cached digests older than the TTL are regenerated."""
+    processor = LLMProcessor(api_key="test-key", model="test-model", cache_dir=tmp_path, cache_ttl=60)
+    processor.client = MagicMock()
+    processor.client.chat.completions.create.side_effect = lambda **kwargs: iter(
+        [_chunk("<p>Digest</p>")]
+    )
+    now = datetime(2024, 1, 20, 9, 30, 0)
+
+    processor.process(sample_items, "{article_list}", "Test Config", now=now)
+    (cached,) = tmp_path.glob("*.html")
+    stale = time.time() - 120
+    os.utime(cached, (stale, stale))
+    processor.process(sample_items, "{article_list}", "Test Config", now=now)
+
+    assert processor.client.chat.completions.create.call_count == 2
@@ -1,5 +1,6 @@
 """Tests for the core.models module."""
 
+from dataclasses import FrozenInstanceError
 from datetime import datetime
 from typing import Dict, Any
 
@@ -148,3 +149,17 @@ def test_digest_result_with_complex_metadata() -> None:
     assert result.metadata["processing_time"] == 45.6
     assert result.metadata["sources"] == ["feed1", "feed2", "feed3"]
     assert result.metadata["tags"] == ["economics", "policy", "technology"]
+
+
+def test_models_use_slots(
+    sample_content_item: ContentItem, sample_digest_result: DigestResult
+) -> None:
+    """Test that the models are slotted and carry no per-instance __dict__."""
+    assert not hasattr(sample_content_item, "__dict__")
+    assert not hasattr(sample_digest_result, "__dict__")
+
+
+def test_digest_result_is_frozen(sample_digest_result: DigestResult) -> None:
+    """Test that a DigestResult cannot be modified after creation."""
+    with pytest.raises(FrozenInstanceError):
+        sample_digest_result.title = "Changed"  # type: ignore[misc]
@@ -0,0 +1,159 @@
+"""Tests for the commands.publish_cmd module."""
+
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from typer.testing import CliRunner
+
+from src.commands.publish_cmd import (
+    app,
+    digest_from_frontmatter,
+    parse_frontmatter,
+    read_file_bytes,
+)
+
+
+def test_read_file_bytes(tmp_path: Path) -> None:
+    """Test reading small, empty and multi-chunk files."""
+    small = tmp_path / "small.md"
+    small.write_bytes("---\ntitle: Café\n---\nBody\n".encode("utf-8"))
+    empty = tmp_path / "empty.md"
+    empty.write_bytes(b"")
+    large = tmp_path / "large.md"
+    large.write_bytes(b"x" * 200_000)
+
+    assert read_file_bytes(small) == small.read_bytes()
+    assert read_file_bytes(empty) == b""
+    assert read_file_bytes(large) == large.read_bytes()
+
+
+def test_parse_frontmatter_with_frontmatter() -> None:
+    """Test parsing YAML frontmatter followed by a markdown body."""
+    content = (
+        b"---\n"
+        b"title: Weekly Digest\n"
+        b"config: AI Weekly\n"
+        b"sources_analyzed: 12\n"
+        b"---\n"
+        b"\n"
+        b"# Heading\n"
+        b"\n"
+        b"Body text.\n"
+    )
+
+    frontmatter, body = parse_frontmatter(content)
+
+    assert frontmatter == {
+        "title": "Weekly Digest",
+        "config": "AI Weekly",
+        "sources_analyzed": 12,
+    }
+    assert body == "# Heading\n\nBody text."
+
+
+def test_parse_frontmatter_without_frontmatter() -> None:
+    """Test that content without frontmatter is returned as the body."""
+    frontmatter, body = parse_frontmatter(b"\n# Just a body\n")
+
+    assert frontmatter == {}
+    assert body == "# Just a body"
+
+
+def test_parse_frontmatter_unterminated() -> None:
+    """Test that an unterminated frontmatter block is treated as body."""
+    content = b"---\ntitle: Broken\n\nBody without closing fence\n"
+
+    frontmatter, body = parse_frontmatter(content)
+
+    assert frontmatter == {}
+    assert body == content.decode("utf-8").strip()
+
+
+def test_parse_frontmatter_ignores_horizontal_rules_in_body() -> None:
+    """Test that only the first closing fence ends the frontmatter."""
+    content = b"---\ntitle: Rules\n---\nIntro\n\n---\n\nMore text\n"
+
+    frontmatter, body = parse_frontmatter(content)
+
+    assert frontmatter == {"title": "Rules"}
+    assert body == "Intro\n\n---\n\nMore text"
+
+
+def test_parse_frontmatter_fences_with_trailing_whitespace() -> None:
+    """Test that fence lines may carry trailing whitespace."""
+    frontmatter, body = parse_frontmatter(b"---  \ntitle: Spaces\n---  \nBody\n")
+
+    assert frontmatter == {"title": "Spaces"}
+    assert body == "Body"
+
+
+def test_parse_frontmatter_decodes_utf8() -> None:
+    """Test that non-ASCII frontmatter and body survive the byte parsing."""
+    content = "---\ntitle: Café Digest\n---\nÜberblick 🚀\n".encode("utf-8")
+
+    frontmatter, body = parse_frontmatter(content)
+
+    assert frontmatter == {"title": "Café Digest"}
+    assert body == "Überblick 🚀"
+
+
+def test_digest_from_frontmatter() -> None:
+    """Test rebuilding a DigestResult from frontmatter fields."""
+    frontmatter = {
+        "title": "Weekly Digest",
+        "date": "2024-01-15T12:00:00",
+        "config": "AI Weekly",
+        "sources_analyzed": 12,
+        "model": "gpt-4o-mini",
+    }
+
+    digest = digest_from_frontmatter(frontmatter, "Body")
+
+    assert digest.title == "Weekly Digest"
+    assert digest.date == datetime(2024, 1, 15, 12, 0, 0)
+    assert digest.config_name == "AI Weekly"
+    assert digest.sources_analyzed == 12
+    assert digest.markdown_body == "Body"
+    assert digest.metadata == {"model": "gpt-4o-mini"}
+
+
+def test_digest_from_frontmatter_accepts_yaml_datetime() -> None:
+    """Test that dates already parsed by YAML are used as-is."""
+    digest = digest_from_frontmatter({"date": datetime(2024, 1, 15)}, "Body")
+
+    assert digest.date == datetime(2024, 1, 15)
+    assert digest.title == "Digest"
+    assert digest.config_name == "unknown"
+    assert digest.sources_analyzed == 0
+
+
+def test_email_sends_all_digests_over_one_connection(tmp_path: Path, monkeypatch) -> None:
+    """Test that `publish email` with several files logs in to SMTP once."""
+    for var, value in {
+        "SMTP_HOST": "smtp.example.com",
+        "SMTP_PORT": "587",
+        "SMTP_USERNAME": "user@example.com",
+        "SMTP_PASSWORD": "secret",
+        "RECIPIENT_EMAIL": "reader@example.com",
+    }.items():
+        monkeypatch.setenv(var, value)
+    monkeypatch.delenv("EMAIL_SENDER_NAME", raising=False)
+
+    paths = []
+    for name in ("AI Weekly", "Tech Daily"):
+        path = tmp_path / f"{name}.md"
+        path.write_text(f"---\ntitle: {name}\nconfig: {name}\n---\n\nBody", encoding="utf-8")
+        paths.append(str(path))
+
+    server = MagicMock()
+    server.noop.return_value = (250, b"OK")
+    with patch("src.config.env.load_env"), \
+            patch("src.publishers.email.smtplib.SMTP", return_value=server) as smtp_cls:
+        result = CliRunner().invoke(app, ["email", *paths])
+
+    assert result.exit_code == 0, result.output
+    smtp_cls.assert_called_once()
+    server.login.assert_called_once()
+    senders = [c.args[0]["From"] for c in server.send_message.call_args_list]
+    assert senders == ["AI Weekly <user@example.com>", "Tech Daily <user@example.com>"]
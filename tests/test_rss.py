@@ -4,10 +4,12 @@ from datetime import datetime, timedelta, timezone
 from typing import Dict
 from unittest.mock import MagicMock, patch
 
+import feedparser
+import httpx
 import pytest
 from dateutil import parser as date_parser
 
-from src.fetchers.rss import RSSFetcher
+from src.fetchers.rss import RSSFetcher, _dedupe_items, _normalize_url, _parse_date_string
 from src.core.models import ContentItem
 
 
@@ -21,9 +23,11 @@ def sample_feeds() -> Dict[str, str]:
 
 
 @pytest.fixture
-def rss_fetcher(sample_feeds: Dict[str, str]) -> RSSFetcher:
-    """Provide RSSFetcher instance for testing."""
-    return RSSFetcher(sample_feeds)
+def rss_fetcher(sample_feeds: Dict[str, str], monkeypatch: pytest.MonkeyPatch) -> RSSFetcher:
+    """Provide RSSFetcher instance for testing (downloads stubbed out)."""
+    fetcher = RSSFetcher(sample_feeds)
+    monkeypatch.setattr(fetcher, "_download_feed", lambda feed_url: (b"", {}))
+    return fetcher
 
 
 @pytest.fixture
@@ -91,12 +95,12 @@ def test_fetch_success(
 
     # Test fetch
     with patch.object(rss_fetcher, "_fetch_single_feed") as mock_fetch_single:
-        mock_fetch_single.return_value = [
+        mock_fetch_single.side_effect = lambda feed_url, feed_name, cutoff_date: [
             ContentItem(
-                title=mock_feed_entry.title,
-                url=mock_feed_entry.link,
+                title=f"{mock_feed_entry.title} ({feed_name})",
+                url=f"{mock_feed_entry.link}?feed={feed_name}",
                 content=mock_feed_entry.summary,
-                source="Test Feed 1",
+                source=feed_name,
                 published_date=date_parser.parse(mock_feed_entry.published),
             )
         ]
@@ -124,7 +128,7 @@ def test_fetch_with_feed_failure(
 
 
 @patch("src.fetchers.rss.feedparser.parse")
-@patch("src.fetchers.rss.date_parser.parse")
+@patch("src.fetchers.rss._parse_date_string")
 def test_fetch_single_feed_success(
     mock_date_parser: MagicMock,
     mock_parse: MagicMock,
@@ -156,7 +160,7 @@ def test_fetch_single_feed_success(
 
 
 @patch("src.fetchers.rss.feedparser.parse")
-@patch("src.fetchers.rss.date_parser.parse")
+@patch("src.fetchers.rss._parse_date_string")
 def test_fetch_single_feed_filters_old_entries(
     mock_date_parser: MagicMock,
     mock_parse: MagicMock,
@@ -194,6 +198,51 @@ def test_fetch_single_feed_filters_old_entries(
     assert result[0].title == "Test Article"
 
 
+@patch("src.fetchers.rss.feedparser.parse")
+def test_fetch_single_feed_prefilters_by_parsed_struct(
+    mock_parse: MagicMock, rss_fetcher: RSSFetcher, mock_feed_entry: MagicMock
+) -> None:
+    """Test that entries older than the cutoff are skipped before date parsing."""
+    mock_feed_entry.published_parsed = (datetime.now(timezone.utc) - timedelta(days=30)).timetuple()
+
+    mock_feed = MagicMock()
+    mock_feed.entries = [mock_feed_entry]
+    mock_parse.return_value = mock_feed
+
+    cutoff_date = datetime.now(timezone.utc) - timedelta(days=7)
+    with patch.object(rss_fetcher, "_parse_date") as mock_parse_date:
+        result = rss_fetcher._fetch_single_feed(
+            "https://example.com/feed.xml", "Test Feed", cutoff_date
+        )
+
+    assert result == []
+    mock_parse_date.assert_not_called()
+
+
+@patch("src.fetchers.rss.feedparser.parse")
+def test_fetch_single_feed_dates_items_from_parsed_struct(
+    mock_parse: MagicMock, rss_fetcher: RSSFetcher, mock_feed_entry: MagicMock
+) -> None:
+    """Test that recent entries take their date from the parsed struct."""
+    published = (datetime.now(timezone.utc) - timedelta(days=1)).replace(microsecond=0)
+    mock_feed_entry.published_parsed = published.timetuple()
+
+    mock_feed = MagicMock()
+    mock_feed.entries = [mock_feed_entry]
+    mock_parse.return_value = mock_feed
+
+    cutoff_date = datetime.now(timezone.utc) - timedelta(days=7)
+    with patch.object(rss_fetcher, "_parse_date") as mock_parse_date:
+        result = rss_fetcher._fetch_single_feed(
+            "https://example.com/feed.xml", "Test Feed", cutoff_date
+        )
+
+    assert len(result) == 1
+    assert result[0].published_date == published
+    assert result[0].published_date.tzinfo == timezone.utc
+    mock_parse_date.assert_not_called()
+
+
 @patch("src.fetchers.rss.feedparser.parse")
 def test_fetch_single_feed_handles_entry_parsing_errors(
     mock_parse: MagicMock, rss_fetcher: RSSFetcher
@@ -441,3 +490,282 @@ def test_fetch_with_different_lookback_periods(
         assert (
             abs((cutoff_date - expected_cutoff).total_seconds()) < 1
         )  # Within 1 second
+
+
+def test_fetch_preserves_feed_order_with_concurrency(sample_feeds: Dict[str, str]) -> None:
+    """Test that results follow config order even if feeds finish out of order."""
+    import threading
+
+    second_done = threading.Event()
+
+    def fake_fetch(feed_url: str, feed_name: str, cutoff_date: datetime):
+        if feed_name == "Test Feed 1":
+            # Only finish once the second feed has completed
+            assert second_done.wait(timeout=5)
+        else:
+            second_done.set()
+        return [
+            ContentItem(title=feed_name, url=feed_url, content="", source=feed_name)
+        ]
+
+    fetcher = RSSFetcher(sample_feeds, max_workers=2)
+    with patch.object(fetcher, "_fetch_single_feed", side_effect=fake_fetch):
+        result = fetcher.fetch(days_lookback=7)
+
+    assert [item.source for item in result] == ["Test Feed 1", "Test Feed 2"]
+
+
+def test_iter_fetch_yields_feeds_as_they_complete(sample_feeds: Dict[str, str]) -> None:
+    """Test that iter_fetch yields feeds in completion order and skips failures."""
+    import threading
+
+    second_done = threading.Event()
+
+    def fake_fetch(feed_url: str, feed_name: str, cutoff_date: datetime):
+        if feed_name == "Test Feed 1":
+            assert second_done.wait(timeout=5)
+            raise ConnectionError("unreachable")
+        second_done.set()
+        return [ContentItem(title=feed_name, url=feed_url, content="", source=feed_name)]
+
+    fetcher = RSSFetcher(sample_feeds, max_workers=2)
+    with patch.object(fetcher, "_fetch_single_feed", side_effect=fake_fetch):
+        results = list(fetcher.iter_fetch(days_lookback=7))
+
+    assert [(name, len(items)) for name, items in results] == [("Test Feed 2", 1)]
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://Example.com/post/", "https://example.com/post"),
+        ("https://example.com/post?utm_source=rss&utm_medium=feed", "https://example.com/post"),
+        ("https://example.com/post?id=7&fbclid=abc#comments", "https://example.com/post?id=7"),
+        ("https://news.ycombinator.com/item?id=123", "https://news.ycombinator.com/item?id=123"),
+    ],
+)
+def test_normalize_url(url: str, expected: str) -> None:
+    """Test that only tracking parameters, fragments and trailing slashes are dropped."""
+    assert _normalize_url(url) == expected
+
+
+def test_dedupe_items_drops_cross_posted_articles() -> None:
+    """Test that duplicates by URL or title are dropped, keeping the first."""
+    items = [
+        ContentItem(title="Big News", url="https://example.com/a", content="", source="Feed 1"),
+        ContentItem(title="Other", url="https://example.com/a/?utm_source=x", content="", source="Feed 2"),
+        ContentItem(title="big  news", url="https://mirror.example.org/a", content="", source="Feed 2"),
+        ContentItem(title="Ask HN", url="https://news.ycombinator.com/item?id=1", content="", source="HN"),
+        ContentItem(title="Show HN", url="https://news.ycombinator.com/item?id=2", content="", source="HN"),
+    ]
+
+    result = _dedupe_items(items)
+
+    assert [(item.title, item.source) for item in result] == [
+        ("Big News", "Feed 1"),
+        ("Ask HN", "HN"),
+        ("Show HN", "HN"),
+    ]
+
+
+def test_dedupe_items_keeps_recurring_titles_within_one_feed() -> None:
+    """Test that same-titled posts from one feed survive while cross-posts are dropped."""
+    items = [
+        ContentItem(title="Weekly Roundup", url="https://example.com/r1", content="", source="Feed 1"),
+        ContentItem(title="Weekly Roundup", url="https://example.com/r2", content="", source="Feed 1"),
+        ContentItem(title="Weekly Roundup", url="https://mirror.example.org/r", content="", source="Feed 2"),
+    ]
+
+    result = _dedupe_items(items)
+
+    assert [item.url for item in result] == ["https://example.com/r1", "https://example.com/r2"]
+
+
+def test_fetch_without_feeds() -> None:
+    """Test that fetching with no feeds returns an empty list."""
+    assert RSSFetcher({}).fetch(days_lookback=7) == []
+
+
+def test_download_feed_returns_body_and_headers() -> None:
+    """Test that feeds are downloaded through the shared client."""
+    response = MagicMock()
+    response.content = b"<rss></rss>"
+    response.headers = {"content-type": "application/rss+xml"}
+
+    fetcher = RSSFetcher({})
+    fetcher._client = MagicMock()
+    fetcher._client.get.return_value = response
+
+    body, headers = fetcher._download_feed("https://example.com/feed.xml")
+
+    assert body == b"<rss></rss>"
+    assert headers == {"content-type": "application/rss+xml"}
+    response.raise_for_status.assert_called_once()
+    fetcher._client.get.assert_called_once_with("https://example.com/feed.xml")
+
+
+def test_download_feed_uses_cache_on_not_modified(tmp_path) -> None:
+    """Test that a 304 response is answered from the feed cache."""
+    url = "https://example.com/feed.xml"
+    fresh = MagicMock(status_code=200, content=b"<rss>v1</rss>", headers={"etag": '"v1"'})
+    not_modified = MagicMock(status_code=304)
+
+    fetcher = RSSFetcher({}, cache_dir=tmp_path)
+    fetcher._client = MagicMock()
+    fetcher._client.get.side_effect = [fresh, not_modified]
+
+    assert fetcher._download_feed(url) == (b"<rss>v1</rss>", {"etag": '"v1"'})
+    assert fetcher._download_feed(url) == (b"<rss>v1</rss>", {"etag": '"v1"'})
+
+    second_call = fetcher._client.get.call_args_list[1]
+    assert second_call.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    not_modified.raise_for_status.assert_not_called()
+
+
+def test_client_is_shared_and_configured() -> None:
+    """Test that one pooled client with feedparser's headers is reused."""
+    with RSSFetcher({}, timeout=5.0) as fetcher:
+        client = fetcher._get_client()
+
+        assert fetcher._get_client() is client
+        assert client.timeout.read == 5.0
+        assert client.follow_redirects is True
+        assert client.headers["User-Agent"].startswith("feedparser/")
+
+    assert fetcher._client is None
+    assert client.is_closed
+
+
+def test_client_honors_environment_proxies(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that HTTPS_PROXY and NO_PROXY apply to feed requests."""
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example.com:3128")
+    monkeypatch.setenv("NO_PROXY", "internal.example.com")
+
+    with RSSFetcher({}) as fetcher:
+        client = fetcher._get_client()
+        proxied = client._transport_for_url(httpx.URL("https://example.com/feed.xml"))
+        direct = client._transport_for_url(httpx.URL("https://internal.example.com/feed.xml"))
+
+        assert type(proxied._pool).__name__ == "HTTPProxy"
+        assert type(direct._pool).__name__ == "ConnectionPool"
+
+
+def test_fetch_single_feed_parses_downloaded_body(rss_fetcher: RSSFetcher) -> None:
+    """Test that the downloaded body is parsed by feedparser."""
+    rss = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>T</title>
+<item><title>Fresh</title><link>https://example.com/fresh</link>
+<description>Fresh summary</description></item>
+</channel></rss>"""
+    rss_fetcher._download_feed = lambda feed_url: (rss, {"content-type": "application/rss+xml"})
+
+    cutoff_date = datetime.now(timezone.utc) - timedelta(days=7)
+    result = rss_fetcher._fetch_single_feed(
+        "https://example.com/feed.xml", "Test Feed", cutoff_date
+    )
+
+    assert [item.title for item in result] == ["Fresh"]
+    assert result[0].url == "https://example.com/fresh"
+    assert result[0].content == "Fresh summary"
+
+
+@pytest.mark.parametrize(
+    "date_str, expected",
+    [
+        ("Mon, 15 Jan 2024 12:00:00 GMT", datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)),
+        ("Mon, 15 Jan 2024 13:00:00 +0100", datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)),
+        ("15 Jan 2024 12:00:00 +0000", datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)),
+        ("2024-01-15T12:00:00Z", datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)),
+        ("2024-01-15T14:00:00+02:00", datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)),
+        ("2024-01-15T12:00:00", datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)),
+        ("January 15, 2024 12:00 PM", datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)),
+    ],
+)
+def test_parse_date_string_formats(date_str: str, expected: datetime) -> None:
+    """Test exact-format parsing and the dateutil fallback."""
+    result = _parse_date_string(date_str)
+
+    assert result == expected
+    assert result.tzinfo is not None
+
+
+def test_parse_date_string_is_memoized() -> None:
+    """Test that repeated date strings are served from the cache."""
+    _parse_date_string.cache_clear()
+    date_str = "Mon, 15 Jan 2024 12:00:00 GMT"
+
+    first = _parse_date_string(date_str)
+    second = _parse_date_string(date_str)
+
+    assert first is second
+    assert _parse_date_string.cache_info().hits == 1
+
+
+def test_parse_date_string_invalid() -> None:
+    """Test that unparseable strings raise ValueError."""
+    with pytest.raises(ValueError):
+        _parse_date_string("invalid-date")
+
+
+def test_parse_date_prefers_parsed_struct_over_string() -> None:
+    """Test that feedparser's struct_time is used before string parsing."""
+    entry = MagicMock()
+    entry.published_parsed = (2024, 1, 15, 12, 0, 0, 0, 15, 0)
+    entry.get.side_effect = lambda key, default=None: {
+        "published": "Tue, 16 Jan 2024 12:00:00 GMT",
+    }.get(key, default)
+
+    with patch("src.fetchers.rss._parse_date_string") as mock_parse_string:
+        result = RSSFetcher({})._parse_date(entry)
+
+    mock_parse_string.assert_not_called()
+    assert result == datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "summary, description, expected",
+    [
+        ("s" * 50, "d" * 50, "s" * 50 + "\n\n" + "d" * 8),
+        ("s" * 80, "d" * 50, "s" * 60),
+        ("short", None, "short"),
+    ],
+)
+@patch("src.fetchers.rss.feedparser.parse")
+def test_content_is_truncated(
+    mock_parse: MagicMock,
+    rss_fetcher: RSSFetcher,
+    summary: str,
+    description: str,
+    expected: str,
+) -> None:
+    """Test that stored content is capped at content_max_chars."""
+    entry = MagicMock()
+    entry.get.side_effect = lambda key, default=None: {
+        "title": "Test Article",
+        "link": "https://example.com/article",
+        "summary": summary,
+        "description": description,
+    }.get(key, default)
+
+    mock_feed = MagicMock()
+    mock_feed.entries = [entry]
+    mock_parse.return_value = mock_feed
+
+    rss_fetcher.content_max_chars = 60
+    cutoff_date = datetime.now(timezone.utc) - timedelta(days=7)
+    result = rss_fetcher._fetch_single_feed(
+        "https://example.com/feed.xml", "Test Feed", cutoff_date
+    )
+
+    assert result[0].content == expected
+
+
+def test_parse_entries_falls_back_to_feedparser(rss_fetcher: RSSFetcher) -> None:
+    """Test that documents the fast parser rejects are handed to feedparser."""
+    body = b"<rss><channel><item><title>Caf&eacute;</title><link>https://example.com/x</link></item></channel></rss>"
+
+    with patch("src.fetchers.rss.feedparser.parse", wraps=feedparser.parse) as mock_parse:
+        entries = rss_fetcher._parse_entries(body, {})
+
+    mock_parse.assert_called_once()
+    assert entries[0].get("title") == "Café"